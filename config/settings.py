@@ -4,6 +4,28 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Environment variable overrides: (variable, (section, key), converter)
+_ENV_MAP = (
+    # Database settings
+    ("ETL_DB_TYPE", ("database", "type"), str),
+    ("ETL_DB_HOST", ("database", "host"), str),
+    ("ETL_DB_PORT", ("database", "port"), int),
+    ("ETL_DB_NAME", ("database", "database"), str),
+    ("ETL_DB_USER", ("database", "user"), str),
+    ("ETL_DB_PASSWORD", ("database", "password"), str),
+    # CSV settings
+    ("ETL_CSV_INPUT_DIR", ("csv", "input_dir"), str),
+    ("ETL_CSV_BATCH_SIZE", ("csv", "batch_size"), int),
+    # Logging settings
+    ("ETL_LOG_LEVEL", ("logging", "level"), str),
+)
+
 class Settings:
     """Configuration settings manager for the ETL pipeline."""
     
@@ -26,6 +48,10 @@ class Settings:
                 "connection_timeout": 30,
                 "max_retries": 3,
                 "retry_delay": 5,
+                "pool_size": 8,
+                "max_overflow": 16,
+                "load_method": "copy",  # or "insert", "adbc"
+                "copy_format": "csv",  # or "binary"
             },
             "csv": {
                 "input_dir": "./data/input",
@@ -35,6 +61,11 @@ class Settings:
                 "quotechar": '"',
                 "encoding": "utf-8",
                 "batch_size": 10000,
+                "engine": "pandas",  # or "pyarrow"
+                "dtype_sample_rows": 0,  # opt-in; 0 disables dtype pinning
+                "dtypes": {},  # column -> dtype, e.g. {"quantity": "Int64"}
+                "date_columns": [],
+                "date_format": None,  # e.g. "%Y-%m-%d"
             },
             "logging": {
                 "level": "INFO",
@@ -47,6 +78,8 @@ class Settings:
                 "parallel": True,
                 "max_workers": 4,
                 "chunk_size": 100000,
+                "prefetch_batches": 2,
+                "io_bound": False,
             }
         }
         
@@ -64,7 +97,7 @@ class Settings:
         """Load configuration from YAML file."""
         try:
             with open(config_path, 'r') as f:
-                file_config = yaml.safe_load(f)
+                file_config = yaml.load(f, Loader=_YamlLoader)
                 if file_config:
                     self._deep_update(self.config, file_config)
         except Exception as e:
@@ -72,37 +105,21 @@ class Settings:
     
     def _load_from_env(self) -> None:
         """Override configuration with environment variables."""
-        # Database settings
-        if os.getenv("ETL_DB_TYPE"):
-            self.config["database"]["type"] = os.getenv("ETL_DB_TYPE")
-        if os.getenv("ETL_DB_HOST"):
-            self.config["database"]["host"] = os.getenv("ETL_DB_HOST")
-        if os.getenv("ETL_DB_PORT"):
-            self.config["database"]["port"] = int(os.getenv("ETL_DB_PORT", "5432"))
-        if os.getenv("ETL_DB_NAME"):
-            self.config["database"]["database"] = os.getenv("ETL_DB_NAME")
-        if os.getenv("ETL_DB_USER"):
-            self.config["database"]["user"] = os.getenv("ETL_DB_USER")
-        if os.getenv("ETL_DB_PASSWORD"):
-            self.config["database"]["password"] = os.getenv("ETL_DB_PASSWORD")
-        
-        # CSV settings
-        if os.getenv("ETL_CSV_INPUT_DIR"):
-            self.config["csv"]["input_dir"] = os.getenv("ETL_CSV_INPUT_DIR")
-        if os.getenv("ETL_CSV_BATCH_SIZE"):
-            self.config["csv"]["batch_size"] = int(os.getenv("ETL_CSV_BATCH_SIZE", "10000"))
-        
-        # Logging settings
-        if os.getenv("ETL_LOG_LEVEL"):
-            self.config["logging"]["level"] = os.getenv("ETL_LOG_LEVEL")
+        for name, (section, key), convert in _ENV_MAP:
+            value = os.environ.get(name)
+            if value:
+                self.config[section][key] = convert(value)
     
     def _deep_update(self, d: Dict[str, Any], u: Dict[str, Any]) -> None:
-        """Recursively update nested dictionaries."""
-        for k, v in u.items():
-            if isinstance(v, dict) and k in d and isinstance(d[k], dict):
-                self._deep_update(d[k], v)
-            else:
-                d[k] = v
+        """Merge nested dictionaries, using an explicit stack instead of recursion."""
+        stack = [(d, u)]
+        while stack:
+            target, updates = stack.pop()
+            for k, v in updates.items():
+                if isinstance(v, dict) and isinstance(target.get(k), dict):
+                    stack.append((target[k], v))
+                else:
+                    target[k] = v
     
     def _setup_directories(self) -> None:
         """Ensure all required directories exist."""
@@ -1,15 +1,24 @@
+from __future__ import annotations
+
 import os
+import codecs
 import csv
-import pandas as pd
+import errno
+import importlib.util
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Generator
+import mmap
+from typing import TYPE_CHECKING, Callable, Dict, List, Any, Optional, Tuple, Generator, BinaryIO
 import shutil
 from datetime import datetime
-import concurrent.futures
 from pathlib import Path
 
 from utils.exceptions import ExtractionError, ValidationError
 
+# pandas and pyarrow are imported where they are used, so listing and
+# archiving files does not pay for loading them
+if TYPE_CHECKING:
+    import pandas as pd
+
 class Extractor:
     """Extract data from CSV files."""
     
@@ -30,6 +39,20 @@ class Extractor:
         self.quotechar = config["quotechar"]
         self.encoding = config["encoding"]
         self.batch_size = config["batch_size"]
+        self.engine = config.get("engine", "pandas")
+        self._schema_cache: Dict[Tuple[str, int, int], List[str]] = {}
+        
+        # Rows sampled to pin numeric dtypes for the chunked parser (0 disables)
+        self.dtype_sample_rows = config.get("dtype_sample_rows", 0)
+        
+        # Declared column types, which take precedence over sampled ones
+        self.dtypes: Dict[str, Any] = config.get("dtypes") or {}
+        self.date_columns: List[str] = config.get("date_columns") or []
+        self.date_format: Optional[str] = config.get("date_format")
+        
+        if self.engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+            self.logger.warning("pyarrow is not installed, falling back to the pandas CSV parser")
+            self.engine = "pandas"
     
     def list_csv_files(self) -> List[Path]:
         """
@@ -44,7 +67,13 @@ class Extractor:
             self.logger.error(f"Input directory {self.input_dir} does not exist")
             raise ExtractionError(f"Input directory {self.input_dir} does not exist")
         
-        csv_files = list(self.input_dir.glob("*.csv"))
+        # scandir reuses the d_type from readdir, so only symlinks need a stat
+        with os.scandir(self.input_dir) as entries:
+            csv_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".csv") and entry.is_file()
+            ]
         self.logger.info(f"Found {len(csv_files)} CSV files in {self.input_dir}")
         
         return csv_files
@@ -53,21 +82,95 @@ class Extractor:
         """
         Get the column names from a CSV file.
         
+        Names are stripped of surrounding whitespace, for comparing against
+        an expected schema; see get_column_names for the names of the
+        DataFrame columns.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            List of column names
+        """
+        return [col.strip() for col in self._read_header(file_path)]
+    
+    def get_column_names(self, file_path: Path) -> List[str]:
+        """
+        Get the DataFrame column names read_csv gives a CSV file.
+        
+        These are the header fields as written, with repeated names made
+        unique the way pandas does (a, a.1).
+        
         Args:
             file_path: Path to CSV file
             
         Returns:
             List of column names
         """
+        return self._dedupe_names(self._read_header(file_path))
+    
+    def _read_header(self, file_path: Path) -> List[str]:
+        """
+        Read the raw header fields of a CSV file.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            Header fields without a leading byte order mark
+        """
         try:
-            with open(file_path, 'r', encoding=self.encoding) as f:
-                reader = csv.reader(f, delimiter=self.delimiter, quotechar=self.quotechar)
-                header = next(reader)
-                return [col.strip() for col in header]
+            # Cache on (path, mtime, size) so repeated calls within a run skip the read
+            st = os.stat(file_path)
+            key = (str(file_path), st.st_mtime_ns, st.st_size)
+            if key in self._schema_cache:
+                return list(self._schema_cache[key])
+            
+            header = self._read_header_mmap(file_path)
+            if header is None:
+                with open(file_path, 'r', encoding=self.encoding) as f:
+                    reader = csv.reader(f, delimiter=self.delimiter, quotechar=self.quotechar)
+                    header = next(reader)
+            # Excel and others start UTF-8 files with a byte order mark, which
+            # read_csv drops from the first name but the decoders above keep
+            if header and header[0].startswith("\ufeff"):
+                header[0] = header[0][1:]
+            
+            self._schema_cache[key] = header
+            return list(header)
         except Exception as e:
             self.logger.error(f"Failed to read schema from {file_path}: {str(e)}")
             raise ExtractionError(f"Failed to read schema from {file_path}: {str(e)}")
     
+    def _read_header_mmap(self, file_path: Path) -> Optional[List[str]]:
+        """
+        Read the header row by scanning a memory map for the first newline.
+        
+        Only the header bytes are decoded. Returns None when this shortcut
+        does not apply (empty file, an encoding that is not ASCII-compatible,
+        a UTF-8 byte order mark, or a quoted newline inside the header), so
+        the caller can fall back to the text reader.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            Raw header fields, or None
+        """
+        if "\n".encode(self.encoding) != b"\n" or os.path.getsize(file_path) == 0:
+            return None
+        
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                return None
+            end = mm.find(b"\n")
+            line = mm[:end if end != -1 else len(mm)].decode(self.encoding).rstrip("\r")
+        
+        if line.count(self.quotechar) % 2:
+            return None
+        
+        return next(csv.reader([line], delimiter=self.delimiter, quotechar=self.quotechar))
+    
     def validate_schema(self, schema: List[str], expected_schema: Optional[List[str]] = None) -> bool:
         """
         Validate CSV schema against expected schema.
@@ -95,17 +198,30 @@ class Extractor:
         
         return True
     
-    def extract_from_file(self, file_path: Path, expected_schema: Optional[List[str]] = None) -> Generator[pd.DataFrame, None, None]:
+    def extract_from_file(
+        self,
+        file_path: Path,
+        expected_schema: Optional[List[str]] = None,
+        **read_options: Any
+    ) -> Generator[pd.DataFrame, None, None]:
         """
         Extract data from a CSV file in batches.
         
         Args:
             file_path: Path to CSV file
             expected_schema: Expected column schema (optional)
+            **read_options: Work pushed into the parser, see
+                Transformer.as_read_csv_kwargs: usecols (callable taking a
+                column name), dtype (mapping of column to dtype),
+                parse_dates (list of columns) and text (list of columns the
+                transform converts, read as strings by the pyarrow engine).
+                Types declared in the csv config take precedence.
             
         Yields:
             Pandas DataFrames containing batches of data
         """
+        import pandas as pd
+        
         self.logger.info(f"Extracting data from {file_path}")
         
         try:
@@ -113,18 +229,36 @@ class Extractor:
             schema = self.get_csv_schema(file_path)
             self.validate_schema(schema, expected_schema)
             
+            # Requested options come from the transformation config, which
+            # may name columns this file does not have; the transform logs those
+            names = self.get_column_names(file_path)
+            present = set(names)
+            if read_options.get("dtype"):
+                read_options["dtype"] = {column: dtype for column, dtype in read_options["dtype"].items() if column in present}
+            if read_options.get("parse_dates"):
+                read_options["parse_dates"] = [column for column in read_options["parse_dates"] if column in present]
+            if read_options.get("text"):
+                read_options["text"] = [column for column in read_options["text"] if column in present]
+            
             # Read the CSV in chunks
-            reader = pd.read_csv(
-                file_path,
-                delimiter=self.delimiter,
-                quotechar=self.quotechar,
-                encoding=self.encoding,
-                chunksize=self.batch_size,
-                low_memory=False
-            )
+            # The header is already parsed, so hand it to the parser instead of re-sniffing it
+            if self.engine == "pyarrow":
+                reader = self._read_batches_pyarrow(file_path, names, **read_options)
+            else:
+                reader = pd.read_csv(
+                    file_path,
+                    delimiter=self.delimiter,
+                    quotechar=self.quotechar,
+                    encoding=self.encoding,
+                    header=0,
+                    names=names,
+                    chunksize=self.batch_size,
+                    low_memory=False,
+                    **self._type_options(file_path, **read_options)
+                )
             
             for i, chunk in enumerate(reader):
-                self.logger.debug(f"Extracted batch {i+1} from {file_path}")
+                self.logger.debug("Extracted batch %d from %s", i + 1, file_path)
                 yield chunk
                 
             self.logger.info(f"Completed extraction from {file_path}")
@@ -138,6 +272,243 @@ class Extractor:
             
             raise ExtractionError(error_msg)
     
+    def _type_options(
+        self,
+        file_path: Path,
+        usecols: Optional[Callable[[str], bool]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        parse_dates: Optional[List[str]] = None,
+        text: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the read_csv type arguments for a file.
+        
+        Declared dtypes override requested ones, which override sampled ones,
+        and date columns are parsed by the reader (with date_format, if set)
+        instead of being inferred.
+        
+        Args:
+            file_path: Path to CSV file
+            usecols: Columns to read (optional)
+            dtype: Requested column dtypes (optional)
+            parse_dates: Requested date columns (optional)
+            text: Columns the transform converts (optional, unused: read_csv
+                infers each chunk separately)
+            
+        Returns:
+            Keyword arguments for pd.read_csv
+        """
+        dtypes = {**self._sample_dtypes(file_path), **(dtype or {}), **self.dtypes}
+        date_columns = list(self.date_columns)
+        date_columns += [column for column in parse_dates or [] if column not in self.dtypes and column not in date_columns]
+        if usecols is not None:
+            date_columns = [column for column in date_columns if usecols(column)]
+        for column in date_columns:
+            dtypes.pop(column, None)
+        
+        options: Dict[str, Any] = {"dtype": dtypes or None}
+        if usecols is not None:
+            options["usecols"] = usecols
+        if date_columns:
+            options["parse_dates"] = date_columns
+            if self.date_format:
+                options["date_format"] = self.date_format
+        return options
+    
+    def _sample_dtypes(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Infer column dtypes from the first rows of a file.
+        
+        Pinning these lets the chunked parser skip per-chunk type inference
+        and keeps dtypes consistent across chunks. Nullable types are used so
+        missing values later in the file still parse, but a value after the
+        sample that does not fit (text or a decimal in a column pinned as
+        integer) fails the extraction, so this is opt-in through
+        dtype_sample_rows. Columns that are empty in the sample are left to
+        the parser.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            Mapping of column name to dtype
+        """
+        import pandas as pd
+        
+        if not self.dtype_sample_rows:
+            return {}
+        
+        sample = self.read_sample(file_path, nrows=self.dtype_sample_rows)
+        dtypes = {}
+        for column, dtype in sample.dtypes.items():
+            if not sample[column].notna().any():
+                continue
+            if pd.api.types.is_bool_dtype(dtype):
+                dtypes[column] = "boolean"
+            elif pd.api.types.is_integer_dtype(dtype):
+                dtypes[column] = "Int64"
+            elif pd.api.types.is_float_dtype(dtype):
+                dtypes[column] = "float64"
+            elif pd.api.types.is_string_dtype(dtype):
+                dtypes[column] = str
+        return dtypes
+    
+    def _read_batches_pyarrow(
+        self,
+        file_path: Path,
+        schema: List[str],
+        usecols: Optional[Callable[[str], bool]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        parse_dates: Optional[List[str]] = None,
+        text: Optional[List[str]] = None
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Read a CSV file with the multi-threaded PyArrow streaming reader.
+        
+        Batches are sized in bytes rather than rows, so the block size is
+        derived from batch_size and the average row length of the file.
+        Undeclared column types are inferred from the first block and a
+        later value that does not fit fails the read, so columns the
+        transform converts anyway are read as strings.
+        
+        Args:
+            file_path: Path to CSV file
+            schema: Column names from the file header
+            usecols: Columns to read (optional)
+            dtype: Requested column dtypes (optional)
+            parse_dates: Requested date columns (optional, not pushed down)
+            text: Columns to read as strings (optional)
+            
+        Yields:
+            Pandas DataFrames containing batches of data
+        """
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        
+        block_size = max(self.batch_size * self._estimate_row_bytes(file_path), 1 << 16)
+        
+        column_types = {column: pa.string() for column in text or []}
+        for column, column_dtype in {**(dtype or {}), **self.dtypes}.items():
+            try:
+                pandas_dtype = pd.api.types.pandas_dtype(column_dtype)
+                if isinstance(pandas_dtype, pd.CategoricalDtype):
+                    column_types[column] = pa.dictionary(pa.int32(), pa.string())
+                elif pd.api.types.is_string_dtype(pandas_dtype):
+                    column_types[column] = pa.string()
+                else:
+                    # Arrow columns are always nullable, so map Int64 & co. to their numpy type
+                    column_types[column] = pa.from_numpy_dtype(getattr(pandas_dtype, "numpy_dtype", pandas_dtype))
+            except (TypeError, ValueError, pa.ArrowNotImplementedError):
+                self.logger.warning(f"dtype '{column_dtype}' for column '{column}' is not supported by the pyarrow engine, ignoring")
+        # Requested parse_dates are left to the transform: unlike read_csv,
+        # Arrow fails the whole read on a value it cannot parse
+        for column in self.date_columns:
+            column_types[column] = pa.timestamp("us")
+        
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(
+                use_threads=True,
+                block_size=block_size,
+                encoding=self.encoding,
+                column_names=schema,
+                skip_rows=1
+            ),
+            parse_options=pacsv.ParseOptions(
+                delimiter=self.delimiter,
+                quote_char=self.quotechar
+            ),
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True,
+                column_types=column_types,
+                include_columns=[column for column in schema if usecols(column)] if usecols else None,
+                timestamp_parsers=[self.date_format] if self.date_format else None
+            )
+        )
+        
+        for batch in reader:
+            yield batch.to_pandas(date_as_object=False)
+    
+    @staticmethod
+    def _dedupe_names(names: List[str]) -> List[str]:
+        """Rename repeated column names to name.1, name.2, ... like pandas' own header parsing."""
+        header = set(names)
+        counts: Dict[str, int] = {}
+        unique = []
+        for name in names:
+            original = name
+            count = counts.get(name, 0)
+            while count > 0:
+                counts[original] = count + 1
+                name = f"{original}.{count}"
+                # Skip suffixes that are already taken by another header name
+                count = count + 1 if name in header else counts.get(name, 0)
+            unique.append(name)
+            counts[name] = count + 1
+        return unique
+    
+    def _estimate_row_bytes(self, file_path: Path, sample_bytes: int = 65536) -> int:
+        """Estimate the average row length in bytes from the head of a file."""
+        with open(file_path, 'rb') as f:
+            head = f.read(sample_bytes)
+        return max(len(head) // max(head.count(b"\n"), 1), 1)
+    
+    def read_sample(self, file_path: Path, nrows: int = 1000) -> pd.DataFrame:
+        """
+        Read the first rows of a CSV file.
+        
+        Args:
+            file_path: Path to CSV file
+            nrows: Number of data rows to read
+            
+        Returns:
+            DataFrame with up to nrows rows
+        """
+        import pandas as pd
+        
+        try:
+            return pd.read_csv(
+                file_path,
+                delimiter=self.delimiter,
+                quotechar=self.quotechar,
+                encoding=self.encoding,
+                header=0,
+                names=self.get_column_names(file_path),
+                nrows=nrows
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to read sample from {file_path}: {str(e)}")
+            raise ExtractionError(f"Failed to read sample from {file_path}: {str(e)}")
+    
+    def open_raw(self, file_path: Path, expected_schema: Optional[List[str]] = None) -> BinaryIO:
+        """
+        Open a CSV file for raw byte streaming, bypassing pandas.
+        
+        The schema is validated first; on failure the file is moved to the
+        error directory just like in extract_from_file.
+        
+        Args:
+            file_path: Path to CSV file
+            expected_schema: Expected column schema (optional)
+            
+        Returns:
+            Binary file object positioned at the start of the file
+        """
+        try:
+            schema = self.get_csv_schema(file_path)
+            self.validate_schema(schema, expected_schema)
+            return open(file_path, 'rb')
+            
+        except Exception as e:
+            error_msg = f"Error opening {file_path} for streaming: {str(e)}"
+            self.logger.error(error_msg)
+            
+            # Move file to error directory
+            self._move_file_to_error(file_path)
+            
+            raise ExtractionError(error_msg)
+    
     def archive_file(self, file_path: Path) -> Path:
         """
         Move processed file to archive directory.
@@ -155,7 +526,7 @@ class Extractor:
             archive_path = self.archive_dir / archive_filename
             
             # Move the file
-            shutil.move(str(file_path), str(archive_path))
+            self._move(file_path, archive_path)
             self.logger.info(f"Archived {file_path} to {archive_path}")
             
             return archive_path
@@ -181,11 +552,20 @@ class Extractor:
             error_path = self.error_dir / error_filename
             
             # Move the file
-            shutil.move(str(file_path), str(error_path))
+            self._move(file_path, error_path)
             self.logger.info(f"Moved failed file {file_path} to {error_path}")
             
             return error_path
             
         except Exception as e:
             self.logger.error(f"Failed to move {file_path} to error directory: {str(e)}")
-            return file_path
\ No newline at end of file
+            return file_path
+    
+    def _move(self, src: Path, dst: Path) -> None:
+        """Move a file with a single rename, copying only across filesystems."""
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dst))
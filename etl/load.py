@@ -1,13 +1,22 @@
+from __future__ import annotations
+
+import importlib.util
+import io
 import logging
-import pandas as pd
-import sqlalchemy
-from sqlalchemy import create_engine, MetaData, Table, Column, inspect
-from sqlalchemy.exc import SQLAlchemyError
+import os
+import tempfile
+from pathlib import Path
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Set, Tuple, BinaryIO
 
 from utils.exceptions import LoadError, DatabaseError
 
+# SQLAlchemy, pandas and the optional ADBC stack are imported where they
+# are used, so constructing a Loader stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
 class Loader:
     """Load data into a database."""
     
@@ -23,12 +32,28 @@ class Loader:
         self.logger = logger
         self.engine = None
         self.connection = None
-        self.metadata = MetaData()  # Create without bind parameter
         
         # Connection settings
         self.connection_timeout = db_config.get("connection_timeout", 30)
         self.max_retries = db_config.get("max_retries", 3)
         self.retry_delay = db_config.get("retry_delay", 5)
+        self.pool_size = db_config.get("pool_size", 8)
+        self.max_overflow = db_config.get("max_overflow", 16)
+        
+        # Reflection state, reused across calls
+        self._inspector = None
+        self._tables: Dict[Optional[str], Set[str]] = {}
+        
+        # Bulk load strategy: "copy" (COPY / LOAD DATA), "insert" (batched INSERT)
+        # or "adbc" (Arrow ingestion, PostgreSQL only)
+        self.load_method = db_config.get("load_method", "copy")
+        # PostgreSQL COPY payload: "csv" or "binary" (fixed-width columns only)
+        self.copy_format = db_config.get("copy_format", "csv")
+        self._adbc_conn = None
+        
+        if self.load_method == "adbc" and importlib.util.find_spec("adbc_driver_postgresql") is None:
+            self.logger.warning("adbc_driver_postgresql is not installed, falling back to COPY")
+            self.load_method = "copy"
     
     def connect(self) -> None:
         """
@@ -37,6 +62,11 @@ class Loader:
         Raises:
             DatabaseError: If connection fails
         """
+        if self.engine is not None:
+            return
+        
+        from sqlalchemy import create_engine, inspect
+        
         db_type = self.db_config["type"]
         host = self.db_config["host"]
         port = self.db_config["port"]
@@ -46,12 +76,27 @@ class Loader:
         
         # Create connection string based on database type
         if db_type.lower() == "postgresql":
-            conn_str = f"postgresql://{user}:{password}@{host}:{port}/{database}"
+            # copy_expert is psycopg2 API, so pin the driver explicitly
+            conn_str = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}"
         elif db_type.lower() == "mysql":
             conn_str = f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}"
         else:
             raise DatabaseError(f"Unsupported database type: {db_type}")
         
+        connect_args = {"connect_timeout": self.connection_timeout}
+        if db_type.lower() == "mysql":
+            # Required for LOAD DATA LOCAL INFILE bulk loads
+            connect_args["local_infile"] = True
+        
+        # The engine owns a connection pool shared by all loads; build it once
+        engine = create_engine(
+            conn_str,
+            connect_args=connect_args,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_pre_ping=True
+        )
+        
         # Attempt connection with retries
         retries = 0
         last_error = None
@@ -59,15 +104,9 @@ class Loader:
         while retries < self.max_retries:
             try:
                 self.logger.info(f"Connecting to {db_type} database at {host}:{port}/{database}")
-                self.engine = create_engine(
-                    conn_str,
-                    connect_args={"connect_timeout": self.connection_timeout}
-                )
-                self.connection = self.engine.connect()
-                
-                # Set engine to metadata after connection is established
-                self.metadata = MetaData()
-                self.metadata.bind = self.engine
+                self.connection = engine.connect()
+                self.engine = engine
+                self._inspector = inspect(engine)
                 
                 self.logger.info("Database connection established")
                 return
@@ -81,6 +120,7 @@ class Loader:
                     time.sleep(self.retry_delay)
         
         # If we get here, all retries failed
+        engine.dispose()
         error_msg = f"Failed to connect to database after {self.max_retries} attempts: {last_error}"
         self.logger.error(error_msg)
         raise DatabaseError(error_msg)
@@ -89,7 +129,18 @@ class Loader:
         """Close database connection."""
         if self.connection:
             self.connection.close()
+            self.connection = None
             self.logger.info("Database connection closed")
+        
+        if self._adbc_conn is not None:
+            self._adbc_conn.close()
+            self._adbc_conn = None
+        
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
+            self._inspector = None
+            self._tables.clear()
     
     def table_exists(self, table_name: str, schema: Optional[str] = None) -> bool:
         """
@@ -104,9 +155,38 @@ class Loader:
         """
         if not self.engine:
             self.connect()
-            
-        inspector = inspect(self.engine)
-        return inspector.has_table(table_name, schema=schema)
+        
+        if table_name in self._tables.get(schema, ()):
+            return True
+        
+        # Re-check misses: another worker may have created the table since the last fetch
+        self.refresh_table_cache(schema)
+        return table_name in self._tables[schema]
+    
+    def refresh_table_cache(self, schema: Optional[str] = None) -> None:
+        """
+        Fetch the table names of a schema in one query.
+        
+        table_exists answers hits from this set, so repeated checks for
+        existing tables cost a single round-trip per schema.
+        
+        Args:
+            schema: Database schema (optional)
+        """
+        if not self.engine:
+            self.connect()
+        
+        self._inspector.clear_cache()
+        self._tables[schema] = set(self._inspector.get_table_names(schema=schema))
+    
+    def _set_table_exists(self, table_name: str, schema: Optional[str], exists: bool) -> None:
+        """Record a table creation or drop in the table cache."""
+        if schema not in self._tables:
+            return
+        if exists:
+            self._tables[schema].add(table_name)
+        else:
+            self._tables[schema].discard(table_name)
     
     def create_table_from_dataframe(
         self,
@@ -131,6 +211,9 @@ class Loader:
         Raises:
             DatabaseError: If table creation fails
         """
+        from pandas.io.sql import get_schema
+        from sqlalchemy import text
+        
         try:
             # Handle table existence based on if_exists parameter
             if self.table_exists(table_name, schema):
@@ -138,17 +221,17 @@ class Loader:
                     raise DatabaseError(f"Table {table_name} already exists")
                 elif if_exists == "replace":
                     self.drop_table(table_name, schema)
-                # For "append", we don't need to do anything
-            
-            # Create table
-            df.head(0).to_sql(
-                table_name,
-                self.engine,
-                schema=schema,
-                if_exists="replace",
-                index=False,
-                dtype=dtypes
-            )
+                else:
+                    # Append keeps the existing table as it is
+                    return
+            
+            # Create table with a single DDL statement generated from the DataFrame dtypes
+            with self.engine.begin() as conn:
+                ddl = get_schema(df, table_name, con=conn, dtype=dtypes, schema=schema)
+                # Escape colons so text() does not read them as bind parameters
+                conn.execute(text(ddl.replace(":", "\\:")))
+            
+            self._set_table_exists(table_name, schema, True)
             
             # Add primary key if specified
             if primary_key:
@@ -176,15 +259,20 @@ class Loader:
         if not primary_key:
             return
             
+        from sqlalchemy import PrimaryKeyConstraint
+        from sqlalchemy.schema import AddConstraint
+        
         try:
             pk_name = f"pk_{table_name}"
             qualified_table = f"{schema+'.' if schema else ''}{table_name}"
             
-            # SQL for adding primary key
-            sql = f"ALTER TABLE {qualified_table} ADD CONSTRAINT {pk_name} PRIMARY KEY ({', '.join(primary_key)})"
+            # DDL construct, so the dialect quotes the table and column names
+            table = self._table_stub(table_name, schema, primary_key)
+            constraint = PrimaryKeyConstraint(*primary_key, name=pk_name)
+            table.append_constraint(constraint)
             
             with self.engine.begin() as conn:
-                conn.execute(sql)
+                conn.execute(AddConstraint(constraint))
                 
             self.logger.info(f"Added primary key {primary_key} to table {qualified_table}")
             
@@ -204,14 +292,16 @@ class Loader:
         Raises:
             DatabaseError: If dropping table fails
         """
+        from sqlalchemy.schema import DropTable
+        
         try:
             qualified_table = f"{schema+'.' if schema else ''}{table_name}"
             
-            # SQL for dropping table
-            sql = f"DROP TABLE IF EXISTS {qualified_table}"
-            
+            # DDL construct, so the dialect quotes the table name
             with self.engine.begin() as conn:
-                conn.execute(sql)
+                conn.execute(DropTable(self._table_stub(table_name, schema), if_exists=True))
+            
+            self._set_table_exists(table_name, schema, False)
                 
             self.logger.info(f"Dropped table {qualified_table}")
             
@@ -248,30 +338,40 @@ class Loader:
             if not self.engine:
                 self.connect()
                 
-            # Check if table exists
-            if not self.table_exists(table_name, schema) and if_exists != "replace":
-                self.logger.info(f"Table {schema+'.' if schema else ''}{table_name} does not exist, creating it")
+            qualified_table = f"{schema+'.' if schema else ''}{table_name}"
+            db_type = self.db_config["type"].lower()
+            
+            # Bulk loaders only write rows, so make sure the table is in place first
+            if if_exists == "replace" or not self.table_exists(table_name, schema):
+                self.logger.info(f"Creating table {qualified_table}")
                 self.create_table_from_dataframe(df, table_name, schema, if_exists="replace")
+            elif if_exists == "fail":
+                raise LoadError(f"Table {qualified_table} already exists")
             
-            # Load data in chunks
-            rows_loaded = 0
-            qualified_table = f"{schema+'.' if schema else ''}{table_name}"
+            self.logger.info("Loading %d rows into %s", len(df), qualified_table)
             
-            self.logger.info(f"Loading {len(df)} rows into {qualified_table}")
-            
-            # Use to_sql for loading
-            df.to_sql(
-                table_name,
-                self.engine,
-                schema=schema,
-                if_exists=if_exists,
-                index=False,
-                chunksize=chunk_size,
-                method="multi"
-            )
+            if db_type == "postgresql" and self.load_method == "adbc":
+                import pyarrow as pa
+                rows_loaded = self._ingest_arrow(pa.Table.from_pandas(df, preserve_index=False), table_name, schema)
+            elif db_type == "postgresql" and self.load_method == "copy":
+                rows_loaded = self._copy_postgresql(df, table_name, schema, chunk_size)
+            elif db_type == "postgresql":
+                rows_loaded = self._insert_postgresql(df, table_name, schema, chunk_size)
+            elif self.load_method == "copy":
+                rows_loaded = self._load_data_mysql(df, table_name, schema, chunk_size)
+            else:
+                df.to_sql(
+                    table_name,
+                    self.engine,
+                    schema=schema,
+                    if_exists="append",
+                    index=False,
+                    chunksize=chunk_size,
+                    method="multi"
+                )
+                rows_loaded = len(df)
             
-            rows_loaded = len(df)
-            self.logger.info(f"Loaded {rows_loaded} rows into {qualified_table}")
+            self.logger.info("Loaded %d rows into %s", rows_loaded, qualified_table)
             
             return rows_loaded
             
@@ -280,6 +380,410 @@ class Loader:
             self.logger.error(error_msg)
             raise LoadError(error_msg)
     
+    def supports_copy(self) -> bool:
+        """Check whether the target database can ingest raw CSV via COPY."""
+        return self.db_config["type"].lower() == "postgresql" and self.load_method != "insert"
+    
+    def copy_from_stream(
+        self,
+        file_obj: BinaryIO,
+        table_name: str,
+        schema: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        header: bool = True,
+        delimiter: str = ",",
+        quotechar: str = '"',
+        encoding: Optional[str] = None
+    ) -> int:
+        """
+        Stream a raw CSV file into a PostgreSQL table with COPY FROM STDIN.
+        
+        No rows are parsed in Python; libpq reads the bytes straight from
+        the file object. The table must already exist.
+        
+        Args:
+            file_obj: Binary file object with CSV content
+            table_name: Name of the table
+            schema: Database schema (optional)
+            columns: Column names in file order (optional)
+            header: Whether the first line is a header to skip
+            delimiter: Field delimiter
+            quotechar: Quote character
+            encoding: Encoding of the file (optional)
+            
+        Returns:
+            Number of rows loaded
+            
+        Raises:
+            LoadError: If loading fails
+        """
+        qualified_table = f"{schema+'.' if schema else ''}{table_name}"
+        
+        try:
+            if not self.supports_copy():
+                raise LoadError(f"COPY is not supported for database type {self.db_config['type']}")
+            
+            if not self.engine:
+                self.connect()
+            
+            options = [
+                "FORMAT csv",
+                f"HEADER {'true' if header else 'false'}",
+                f"DELIMITER {self._quote_literal(delimiter)}",
+                f"QUOTE {self._quote_literal(quotechar)}",
+            ]
+            if encoding:
+                options.append(f"ENCODING {self._quote_literal(encoding)}")
+            
+            cols = f" ({', '.join(self._quote_identifier(col) for col in columns)})" if columns else ""
+            sql = f"COPY {self._qualified_name(table_name, schema)}{cols} FROM STDIN WITH ({', '.join(options)})"
+            
+            self.logger.info(f"Streaming CSV into {qualified_table} with COPY")
+            
+            raw_conn = self.engine.raw_connection()
+            try:
+                cursor = raw_conn.cursor()
+                try:
+                    cursor.copy_expert(sql, file_obj)
+                    rows_loaded = cursor.rowcount
+                finally:
+                    cursor.close()
+                raw_conn.commit()
+            except Exception:
+                raw_conn.rollback()
+                raise
+            finally:
+                raw_conn.close()
+            
+            self.logger.info("Loaded %d rows into %s", rows_loaded, qualified_table)
+            
+            return rows_loaded
+            
+        except Exception as e:
+            error_msg = f"Error streaming data into {qualified_table}: {str(e)}"
+            self.logger.error(error_msg)
+            raise LoadError(error_msg)
+    
+    @staticmethod
+    def _table_stub(table_name: str, schema: Optional[str] = None, columns: Optional[List[str]] = None) -> Any:
+        """
+        Build an untyped Table for compiling DDL without reflecting it.
+        
+        Args:
+            table_name: Name of the table
+            schema: Database schema (optional)
+            columns: Column names the DDL refers to (optional)
+            
+        Returns:
+            SQLAlchemy Table object
+        """
+        from sqlalchemy import Column, MetaData, Table
+        
+        return Table(table_name, MetaData(), *(Column(col) for col in columns or []), schema=schema)
+    
+    def _quote_identifier(self, name: str) -> str:
+        """Quote an identifier using the engine's dialect rules."""
+        return self.engine.dialect.identifier_preparer.quote(str(name))
+    
+    def _qualified_name(self, table_name: str, schema: Optional[str] = None) -> str:
+        """Build a quoted, schema-qualified table name."""
+        quoted_table = self._quote_identifier(table_name)
+        return f"{self._quote_identifier(schema)}.{quoted_table}" if schema else quoted_table
+    
+    @staticmethod
+    def _quote_literal(value: str) -> str:
+        """Quote a string literal for inline use in a SQL statement."""
+        return "'" + value.replace("'", "''") + "'"
+    
+    def _copy_postgresql(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        schema: Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> int:
+        """
+        Bulk load a DataFrame into PostgreSQL using COPY FROM STDIN.
+        
+        Each chunk is serialized to an in-memory CSV buffer and streamed
+        through the raw psycopg2 connection, bypassing SQLAlchemy's
+        per-row parameter binding. With copy_format "binary", chunks whose
+        columns are all fixed-width and null-free are sent in PostgreSQL's
+        binary COPY format instead.
+        
+        Args:
+            df: DataFrame with data
+            table_name: Name of the table
+            schema: Database schema (optional)
+            chunk_size: Number of rows per COPY buffer
+            
+        Returns:
+            Number of rows loaded
+        """
+        cols = ", ".join(self._quote_identifier(col) for col in df.columns)
+        sql = f"COPY {self._qualified_name(table_name, schema)} ({cols}) FROM STDIN WITH CSV"
+        binary_sql = f"COPY {self._qualified_name(table_name, schema)} ({cols}) FROM STDIN WITH (FORMAT binary)"
+        
+        raw_conn = self.engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                for start in range(0, len(df), chunk_size):
+                    chunk = df.iloc[start:start + chunk_size]
+                    
+                    payload = self._encode_copy_binary(chunk) if self.copy_format == "binary" else None
+                    if payload is not None:
+                        cursor.copy_expert(binary_sql, io.BytesIO(payload))
+                        continue
+                    
+                    buf = io.StringIO()
+                    chunk.to_csv(buf, index=False, header=False)
+                    buf.seek(0)
+                    cursor.copy_expert(sql, buf)
+            finally:
+                cursor.close()
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+        
+        return len(df)
+    
+    def _ingest_arrow(self, table: pa.Table, table_name: str, schema: Optional[str] = None) -> int:
+        """
+        Load an Arrow table into PostgreSQL through ADBC.
+        
+        Columns are sent in PostgreSQL's binary COPY format straight from
+        the Arrow buffers, without converting cells to Python objects.
+        
+        Args:
+            table: Arrow table or record batch with data
+            table_name: Name of the table
+            schema: Database schema (optional)
+            
+        Returns:
+            Number of rows loaded
+        """
+        if self._adbc_conn is None:
+            import adbc_driver_postgresql.dbapi as adbc_pg
+            
+            uri = (
+                f"postgresql://{self.db_config['user']}:{self.db_config['password']}"
+                f"@{self.db_config['host']}:{self.db_config['port']}/{self.db_config['database']}"
+            )
+            self._adbc_conn = adbc_pg.connect(uri)
+        
+        try:
+            with self._adbc_conn.cursor() as cursor:
+                cursor.adbc_ingest(table_name, table, mode="append", db_schema_name=schema)
+            self._adbc_conn.commit()
+        except Exception:
+            self._adbc_conn.rollback()
+            raise
+        
+        return table.num_rows
+    
+    @staticmethod
+    def _encode_copy_binary(df: pd.DataFrame) -> Optional[bytes]:
+        """
+        Encode a DataFrame in PostgreSQL's binary COPY format.
+        
+        Rows are laid out as a single numpy structured array (field count,
+        then a length and big-endian value per column), so encoding is
+        vectorized with no per-row Python work. Only fixed-width columns
+        without missing values can be encoded this way, and their types
+        must match the ones pandas uses when creating the table
+        (smallint/integer/bigint, real/double precision, boolean, timestamp).
+        
+        Args:
+            df: DataFrame with data
+            
+        Returns:
+            Encoded COPY payload, or None if a column cannot be encoded
+        """
+        import numpy as np
+        import pandas as pd
+        
+        # Microseconds between the Unix epoch and PostgreSQL's 2000-01-01 epoch
+        pg_epoch_offset = 946684800000000
+        
+        fields = [("n", ">i2")]
+        values = []
+        for i, column in enumerate(df.columns):
+            series = df[column]
+            if series.hasnans:
+                return None
+            
+            dtype = series.dtype
+            if pd.api.types.is_bool_dtype(dtype):
+                wire_type, data = "?", series.to_numpy(dtype=bool)
+            elif pd.api.types.is_integer_dtype(dtype):
+                itemsize = np.dtype(dtype.numpy_dtype if hasattr(dtype, "numpy_dtype") else dtype).itemsize
+                unsigned = pd.api.types.is_unsigned_integer_dtype(dtype)
+                # Same widening as pandas' SMALLINT/INTEGER/BIGINT mapping
+                width = {1: 2, 2: 4 if unsigned else 2, 4: 8 if unsigned else 4, 8: 8}[itemsize]
+                if unsigned and itemsize == 8:
+                    return None
+                wire_type, data = f">i{width}", series.to_numpy(dtype=f"i{width}")
+            elif pd.api.types.is_float_dtype(dtype):
+                width = np.dtype(dtype.numpy_dtype if hasattr(dtype, "numpy_dtype") else dtype).itemsize
+                if width not in (4, 8):
+                    return None
+                wire_type, data = f">f{width}", series.to_numpy(dtype=f"f{width}")
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                if getattr(dtype, "tz", None) is not None:
+                    series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+                micros = series.to_numpy().astype("datetime64[us]").astype("int64")
+                wire_type, data = ">i8", micros - pg_epoch_offset
+            else:
+                return None
+            
+            fields.extend([(f"l{i}", ">i4"), (f"v{i}", wire_type)])
+            values.append((np.dtype(wire_type).itemsize, data))
+        
+        rows = np.empty(len(df), dtype=fields)
+        rows["n"] = len(df.columns)
+        for i, (size, data) in enumerate(values):
+            rows[f"l{i}"] = size
+            rows[f"v{i}"] = data
+        
+        header = b"PGCOPY\n\xff\r\n\x00" + b"\x00\x00\x00\x00" + b"\x00\x00\x00\x00"
+        trailer = b"\xff\xff"
+        return header + rows.tobytes() + trailer
+    
+    def _insert_postgresql(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        schema: Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> int:
+        """
+        Load a DataFrame into PostgreSQL with psycopg2's execute_values.
+        
+        Used when COPY is not available. Rows are sent as multi-row INSERT
+        statements, one round-trip per page of chunk_size rows.
+        
+        Args:
+            df: DataFrame with data
+            table_name: Name of the table
+            schema: Database schema (optional)
+            chunk_size: Number of rows per INSERT statement
+            
+        Returns:
+            Number of rows loaded
+        """
+        from psycopg2.extras import execute_values
+        
+        cols = ", ".join(self._quote_identifier(col) for col in df.columns)
+        sql = f"INSERT INTO {self._qualified_name(table_name, schema)} ({cols}) VALUES %s"
+        
+        # psycopg2 cannot adapt numpy scalars or pandas NA markers
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        
+        raw_conn = self.engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                execute_values(cursor, sql, rows, page_size=chunk_size)
+            finally:
+                cursor.close()
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+        
+        return len(df)
+    
+    @staticmethod
+    def _mysql_csv_frame(chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Prepare a chunk for writing as a LOAD DATA input file.
+        
+        Backslash is MySQL's escape character, so it is doubled in text
+        columns (categoricals are turned into plain objects first, since
+        new values cannot be set on them). Booleans are written as 1/0:
+        LOAD DATA reads True/False as 0 with only a warning.
+        
+        Args:
+            chunk: DataFrame to write
+            
+        Returns:
+            DataFrame with the same columns, in order, ready for to_csv
+        """
+        import pandas as pd
+        
+        columns = {}
+        for position, (_, series) in enumerate(chunk.items()):
+            dtype = series.dtype
+            if pd.api.types.is_bool_dtype(dtype):
+                series = series.astype("Int8")
+            elif isinstance(dtype, pd.CategoricalDtype) or dtype == object or pd.api.types.is_string_dtype(dtype):
+                series = series.astype(object).replace(r"\\", r"\\\\", regex=True)
+            columns[position] = series
+        return pd.DataFrame(columns, index=chunk.index)
+    
+    def _load_data_mysql(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        schema: Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> int:
+        """
+        Bulk load a DataFrame into MySQL using LOAD DATA LOCAL INFILE.
+        
+        Each chunk is written to a temporary CSV file which the client
+        streams to the server. Requires ``local_infile`` to be enabled on
+        the server.
+        
+        Args:
+            df: DataFrame with data
+            table_name: Name of the table
+            schema: Database schema (optional)
+            chunk_size: Number of rows per temporary file
+            
+        Returns:
+            Number of rows loaded
+        """
+        cols = ", ".join(self._quote_identifier(col) for col in df.columns)
+        
+        raw_conn = self.engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                for start in range(0, len(df), chunk_size):
+                    chunk = self._mysql_csv_frame(df.iloc[start:start + chunk_size])
+                    fd, tmp_path = tempfile.mkstemp(suffix=".csv")
+                    try:
+                        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                            chunk.to_csv(f, index=False, header=False, na_rep="\\N")
+                        sql = (
+                            f"LOAD DATA LOCAL INFILE '{Path(tmp_path).as_posix()}' "
+                            f"INTO TABLE {self._qualified_name(table_name, schema)} "
+                            "CHARACTER SET utf8mb4 "
+                            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                            "LINES TERMINATED BY '\\n' "
+                            f"({cols})"
+                        )
+                        cursor.execute(sql)
+                    finally:
+                        os.remove(tmp_path)
+            finally:
+                cursor.close()
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+        
+        return len(df)
+    
     def execute_sql(self, sql: str) -> Any:
         """
         Execute SQL statement.
@@ -297,8 +801,10 @@ class Loader:
             if not self.connection:
                 self.connect()
                 
-            self.logger.debug(f"Executing SQL: {sql}")
-            result = self.connection.execute(sql)
+            from sqlalchemy import text
+            
+            self.logger.debug("Executing SQL: %s", sql)
+            result = self.connection.execute(text(sql) if isinstance(sql, str) else sql)
             return result
             
         except Exception as e:
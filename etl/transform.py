@@ -1,12 +1,100 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Any, Optional, Callable
+import json
+import importlib.util
+import itertools
+import warnings
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import re
 from datetime import datetime
 
 from utils.exceptions import TransformationError, ValidationError
 
+# Numeric convert_types targets; integers use the nullable extension types
+# so missing values survive, the narrower ones halve memory and COPY size
+_NUMERIC_TYPES = {
+    "int": "Int64",
+    "int32": "Int32",
+    "int16": "Int16",
+    "int8": "Int8",
+    "float": "float64",
+    "float32": "float32",
+}
+
+# What astype(str) produces: object before pandas 3, the string dtype after
+_STR_DTYPE = pd.Series([], dtype=str).dtype
+
+# Text cleanup uses Arrow compute kernels when pyarrow is installed
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Validation rules that check columns one value at a time and can share a pass
+_COLUMN_RULES = ("not_null", "range")
+
+def _numeric_stats(df: pd.DataFrame, columns: List[str]) -> Dict[str, Tuple[bool, Any, Any]]:
+    """
+    Null flag, minimum and maximum of the numpy-backed numeric columns among columns.
+    
+    Columns sharing a dtype are reduced together as one 2-D array, so a
+    frame with many numeric columns takes a handful of numpy calls instead
+    of three pandas calls per column. Other columns (nullable extension
+    types, text, dates) and empty frames are left out for pandas to check.
+    Minimum and maximum skip NaN like Series.min() and Series.max().
+    
+    Args:
+        df: DataFrame to inspect
+        columns: Columns of interest
+        
+    Returns:
+        Mapping of column name to (has nulls, minimum, maximum)
+    """
+    stats: Dict[str, Tuple[bool, Any, Any]] = {}
+    if len(df) == 0:
+        return stats
+    
+    by_dtype: Dict[np.dtype, List[str]] = {}
+    dtypes = df.dtypes
+    for column in dict.fromkeys(columns):
+        if column in dtypes.index and dtypes.index.is_unique:
+            dtype = dtypes[column]
+            if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+                by_dtype.setdefault(dtype, []).append(column)
+    
+    for dtype, group in by_dtype.items():
+        values = df[group].to_numpy()
+        if dtype.kind == "f":
+            nulls = np.isnan(values).any(axis=0)
+            with warnings.catch_warnings():
+                # All-NaN columns give NaN bounds, which compare False like pandas' NaN
+                warnings.simplefilter("ignore", RuntimeWarning)
+                lows = np.nanmin(values, axis=0)
+                highs = np.nanmax(values, axis=0)
+        else:
+            nulls = np.zeros(len(group), dtype=bool)
+            lows = values.min(axis=0)
+            highs = values.max(axis=0)
+        for i, column in enumerate(group):
+            stats[column] = (bool(nulls[i]), lows[i], highs[i])
+    
+    return stats
+
+# Copy-on-Write is always on from pandas 3 and opt-in on pandas 2
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+def enable_copy_on_write() -> None:
+    """
+    Turn on pandas Copy-on-Write where it is still optional (pandas 2.x).
+    
+    With it, transform() can start from a shallow copy of each batch, and
+    only the columns a step writes to get copied.
+    """
+    if _PANDAS_MAJOR < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas Copy-on-Write is active."""
+    return _PANDAS_MAJOR >= 3 or pd.get_option("mode.copy_on_write") is True
+
 class Transformer:
     """Transform and validate data."""
     
@@ -18,7 +106,10 @@ class Transformer:
             logger: Logger instance
         """
         self.logger = logger
+        # Checked once so debug-only work is skipped cheaply on hot paths
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         self.transformation_registry = {}
+        self._plans: Dict[str, List[Dict[str, Any]]] = {}
     
     def register_transformation(self, name: str, transformation_fn: Callable) -> None:
         """
@@ -29,12 +120,19 @@ class Transformer:
             transformation_fn: Transformation function
         """
         self.transformation_registry[name] = transformation_fn
-        self.logger.debug(f"Registered transformation '{name}'")
+        if self._debug:
+            self.logger.debug("Registered transformation '%s'", name)
     
     def transform(self, df: pd.DataFrame, transformations: List[Dict[str, Any]]) -> pd.DataFrame:
         """
         Apply transformations to DataFrame.
         
+        The input is copied once up front (shallowly under Copy-on-Write,
+        see enable_copy_on_write); the helpers below then modify that copy
+        in place, so the caller's DataFrame is left untouched.
+        
+        With no transformations the input is returned as is, without a copy.
+        
         Args:
             df: Input DataFrame
             transformations: List of transformation configurations
@@ -42,46 +140,220 @@ class Transformer:
         Returns:
             Transformed DataFrame
         """
-        transformed_df = df.copy()
+        if not transformations:
+            return df
+        return self.compile(transformations)(df)
+    
+    def compile(self, transformations: List[Dict[str, Any]]) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """
+        Compile transformation configurations into a single function.
         
-        try:
-            for transformation in transformations:
-                t_type = transformation.get("type")
+        The config is parsed once and each step is bound to its helper and
+        arguments, so applying the result to many batches skips the per-batch
+        dispatch. Custom transformations are looked up in the registry now,
+        so register them before compiling.
+        
+        Args:
+            transformations: List of transformation configurations
+            
+        Returns:
+            Function taking a DataFrame and returning the transformed copy
+        """
+        steps = [step for step in map(self._compile_step, self._plan(transformations)) if step is not None]
+        count = len(transformations)
+        # Under Copy-on-Write, columns are only copied once a step writes to them
+        deep = not _copy_on_write_enabled()
+        
+        def apply(df: pd.DataFrame) -> pd.DataFrame:
+            transformed_df = df.copy(deep=deep)
+            
+            try:
+                for step in steps:
+                    transformed_df = step(transformed_df)
                 
-                if t_type == "rename_columns":
-                    mapping = transformation.get("mapping", {})
-                    transformed_df = self._rename_columns(transformed_df, mapping)
-                    
-                elif t_type == "drop_columns":
-                    columns = transformation.get("columns", [])
-                    transformed_df = self._drop_columns(transformed_df, columns)
-                    
-                elif t_type == "fill_na":
-                    columns = transformation.get("columns", {})
-                    transformed_df = self._fill_na(transformed_df, columns)
-                    
-                elif t_type == "convert_types":
-                    type_mapping = transformation.get("mapping", {})
-                    transformed_df = self._convert_types(transformed_df, type_mapping)
-                    
-                elif t_type == "custom":
-                    name = transformation.get("name")
-                    params = transformation.get("params", {})
-                    if name in self.transformation_registry:
-                        transformed_df = self.transformation_registry[name](transformed_df, **params)
-                    else:
-                        self.logger.warning(f"Custom transformation '{name}' not found")
+                self.logger.info("Applied %d transformations", count)
+                return transformed_df
                 
-                else:
-                    self.logger.warning(f"Unknown transformation type: {t_type}")
+            except Exception as e:
+                error_msg = f"Error during transformation: {str(e)}"
+                self.logger.error(error_msg)
+                raise TransformationError(error_msg)
+        
+        return apply
+    
+    def _compile_step(self, transformation: Dict[str, Any]) -> Optional[Callable[[pd.DataFrame], pd.DataFrame]]:
+        """Bind one transformation to its helper; None for steps that do nothing."""
+        t_type = transformation.get("type")
+        
+        if t_type == "rename_columns":
+            mapping = transformation.get("mapping", {})
+            return lambda df: self._rename_columns(df, mapping)
+            
+        elif t_type == "drop_columns":
+            columns = transformation.get("columns", [])
+            return lambda df: self._drop_columns(df, columns)
+            
+        elif t_type == "fill_na":
+            columns = transformation.get("columns", {})
+            return lambda df: self._fill_na(df, columns)
+            
+        elif t_type == "convert_types":
+            type_mapping = transformation.get("mapping", {})
+            auto_category = transformation.get("auto_category", False)
+            return lambda df: self._convert_types(df, type_mapping, auto_category)
+            
+        elif t_type == "custom":
+            name = transformation.get("name")
+            params = transformation.get("params", {})
+            if name in self.transformation_registry:
+                transformation_fn = self.transformation_registry[name]
+                return lambda df: transformation_fn(df, **params)
+            self.logger.warning(f"Custom transformation '{name}' not found")
+        
+        else:
+            self.logger.warning(f"Unknown transformation type: {t_type}")
+        
+        return None
+    
+    def as_read_csv_kwargs(self, transformations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Translate the leading steps of a transformation config into reader options.
+        
+        Only the drop_columns and convert_types steps before the first step
+        of any other type are used, since later steps may rename columns or
+        change values first. Dropped columns are not read, "str" and
+        "category" targets are parsed straight into that dtype and
+        "datetime" targets are parsed as dates. Numeric targets stay with
+        convert_types, which turns invalid values into nulls where the
+        reader would fail; they are listed under text so readers that fix
+        types per file (the pyarrow engine) keep them as text until then.
+        The steps themselves still run after reading and are cheap for
+        columns that already have their type.
+        
+        Args:
+            transformations: List of transformation configurations
+            
+        Returns:
+            Keyword arguments for Extractor.extract_from_file
+        """
+        dropped = set()
+        targets: Dict[str, set] = {}
+        
+        for transformation in self._plan(transformations):
+            t_type = transformation.get("type")
+            if t_type == "drop_columns":
+                dropped.update(transformation.get("columns", []))
+            elif t_type == "convert_types":
+                for column, dtype in transformation.get("mapping", {}).items():
+                    targets.setdefault(column, set()).add(dtype)
+            else:
+                break
+        
+        converted = [column for column in targets if column not in dropped]
+        # Columns converted to more than one type are left to the transform
+        targets = {column: dtypes.pop() for column, dtypes in targets.items() if len(dtypes) == 1 and column not in dropped}
+        
+        options: Dict[str, Any] = {}
+        if dropped:
+            dropped = frozenset(dropped)
+            options["usecols"] = lambda column: column not in dropped
+        dtype = {column: target for column, target in targets.items() if target in ("str", "category")}
+        if dtype:
+            options["dtype"] = dtype
+        parse_dates = [column for column, target in targets.items() if target == "datetime"]
+        if parse_dates:
+            options["parse_dates"] = parse_dates
+        text = [column for column in converted if column not in dtype]
+        if text:
+            options["text"] = text
+        return options
+    
+    def _plan(self, transformations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return the coalesced steps for a transformation config.
+        
+        Plans are cached by the config's JSON form, so each batch of a file
+        reuses the plan built for the first one.
+        
+        Args:
+            transformations: List of transformation configurations
+            
+        Returns:
+            Equivalent list with consecutive mergeable steps combined
+        """
+        try:
+            key = json.dumps(transformations, sort_keys=True)
+        except (TypeError, ValueError):
+            # Custom params that are not JSON-serializable; plan without caching
+            return self._coalesce(transformations)
+        
+        if key not in self._plans:
+            self._plans[key] = self._coalesce(transformations)
+        return self._plans[key]
+    
+    @staticmethod
+    def _coalesce(transformations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge consecutive rename_columns, fill_na and convert_types steps.
+        
+        A convert_types step also merges with an earlier one across fill_na
+        steps on other columns, since filling and converting different
+        columns can run in either order.
+        """
+        plan: List[Dict[str, Any]] = []
+        
+        for transformation in transformations:
+            t_type = transformation.get("type")
+            position = len(plan) - 1
+            if t_type == "convert_types":
+                converted = transformation.get("mapping", {}).keys()
+                while (
+                    position >= 0
+                    and plan[position].get("type") == "fill_na"
+                    and converted.isdisjoint(plan[position].get("columns", {}))
+                ):
+                    position -= 1
+                if position < 0 or plan[position].get("type") != t_type:
+                    position = len(plan) - 1
+            previous = plan[position] if plan else None
             
-            self.logger.info(f"Applied {len(transformations)} transformations")
-            return transformed_df
+            if previous is None or previous.get("type") != t_type:
+                plan.append(dict(transformation))
+                continue
             
-        except Exception as e:
-            error_msg = f"Error during transformation: {str(e)}"
-            self.logger.error(error_msg)
-            raise TransformationError(error_msg)
+            if t_type == "rename_columns":
+                # Compose the mappings: a->b followed by b->c renames a to c
+                first = previous.get("mapping", {})
+                second = transformation.get("mapping", {})
+                merged = {old: second.get(new, new) for old, new in first.items()}
+                for old, new in second.items():
+                    merged.setdefault(old, new)
+                previous["mapping"] = merged
+                
+            elif t_type == "fill_na":
+                # Once a column is filled a later fill has nothing left to fill
+                previous["columns"] = {**transformation.get("columns", {}), **previous.get("columns", {})}
+                
+            elif t_type == "convert_types" and Transformer._can_merge_types(previous, transformation):
+                previous["mapping"] = {**previous.get("mapping", {}), **transformation.get("mapping", {})}
+                
+            else:
+                plan.append(dict(transformation))
+        
+        return plan
+    
+    @staticmethod
+    def _can_merge_types(first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+        """Whether two convert_types steps can run as one without changing results."""
+        if first.get("auto_category", False) != second.get("auto_category", False):
+            return False
+        # Converting a column twice is not the same as converting it once,
+        # unless both steps target the same type
+        first_mapping = first.get("mapping", {})
+        return all(
+            first_mapping.get(column, dtype) == dtype
+            for column, dtype in second.get("mapping", {}).items()
+        )
     
     def validate_data(self, df: pd.DataFrame, validations: List[Dict[str, Any]]) -> bool:
         """
@@ -97,110 +369,254 @@ class Transformer:
         Raises:
             ValidationError: If validation fails
         """
-        try:
-            for validation in validations:
-                v_type = validation.get("type")
+        if not validations:
+            return True
+        return self.compile_validations(validations)(df)
+    
+    def compile_validations(self, validations: List[Dict[str, Any]]) -> Callable[[pd.DataFrame], bool]:
+        """
+        Compile validation rules into a single function.
+        
+        Like compile(), the rules are parsed once so applying the result to
+        many batches only runs the checks themselves.
+        
+        Args:
+            validations: List of validation rules
+            
+        Returns:
+            Function taking a DataFrame, returning True if all validations
+            pass and raising ValidationError otherwise
+            
+        Raises:
+            ValidationError: If a regex rule has an invalid pattern
+        """
+        checks = []
+        for fusable, group in itertools.groupby(validations, key=lambda v: v.get("type") in _COLUMN_RULES):
+            if fusable:
+                checks.append(self._compile_column_checks(list(group)))
+            else:
+                checks.extend(check for check in map(self._compile_check, group) if check is not None)
+        count = len(validations)
+        
+        def check_all(df: pd.DataFrame) -> bool:
+            try:
+                for check in checks:
+                    check(df)
                 
+                self.logger.info("Data passed %d validations", count)
+                return True
+                
+            except ValidationError as e:
+                raise e
+            except Exception as e:
+                error_msg = f"Error during validation: {str(e)}"
+                self.logger.error(error_msg)
+                raise ValidationError(error_msg)
+        
+        return check_all
+    
+    def _compile_column_checks(self, validations: List[Dict[str, Any]]) -> Callable[[pd.DataFrame], None]:
+        """
+        Bind a run of consecutive not_null and range rules to one check.
+        
+        The null flags and bounds of all numeric columns the rules mention
+        are computed up front in a few vectorized reductions (see
+        _numeric_stats); the rules are then checked in order, so the first
+        failing rule raises the same error as when checked one by one.
+        """
+        rules = []
+        columns = []
+        for validation in validations:
+            if validation.get("type") == "not_null":
+                rules.append(("not_null", validation.get("columns", []), None, None))
+                columns.extend(validation.get("columns", []))
+            else:
+                rules.append(("range", [validation.get("column")], validation.get("min"), validation.get("max")))
+                columns.append(validation.get("column"))
+        
+        def check(df: pd.DataFrame) -> None:
+            stats = _numeric_stats(df, columns)
+            
+            for v_type, rule_columns, min_val, max_val in rules:
                 if v_type == "not_null":
-                    columns = validation.get("columns", [])
-                    for column in columns:
-                        if df[column].isnull().any():
+                    for column in rule_columns:
+                        has_nulls = stats[column][0] if column in stats else df[column].hasnans
+                        if has_nulls:
                             raise ValidationError(f"Column '{column}' contains NULL values")
+                    continue
                 
-                elif v_type == "unique":
-                    columns = validation.get("columns", [])
-                    for column in columns:
-                        if df[column].duplicated().any():
-                            raise ValidationError(f"Column '{column}' contains duplicate values")
-                
-                elif v_type == "range":
-                    column = validation.get("column")
-                    min_val = validation.get("min")
-                    max_val = validation.get("max")
-                    
-                    if min_val is not None and df[column].min() < min_val:
+                column = rule_columns[0]
+                if min_val is not None:
+                    low = stats[column][1] if column in stats else df[column].min()
+                    if low < min_val:
                         raise ValidationError(f"Column '{column}' contains values below minimum {min_val}")
-                        
-                    if max_val is not None and df[column].max() > max_val:
+                    
+                if max_val is not None:
+                    high = stats[column][2] if column in stats else df[column].max()
+                    if high > max_val:
                         raise ValidationError(f"Column '{column}' contains values above maximum {max_val}")
-                
-                elif v_type == "regex":
-                    column = validation.get("column")
-                    pattern = validation.get("pattern")
-                    if not df[column].astype(str).str.match(pattern).all():
-                        raise ValidationError(f"Column '{column}' contains values not matching pattern '{pattern}'")
-                
-                elif v_type == "custom":
-                    validation_fn = validation.get("function")
-                    if not validation_fn(df):
-                        raise ValidationError(f"Custom validation failed: {validation.get('message', 'No message provided')}")
+        
+        return check
+    
+    def _compile_check(self, validation: Dict[str, Any]) -> Optional[Callable[[pd.DataFrame], None]]:
+        """Bind one validation rule to a check that raises ValidationError; None for unknown rules."""
+        v_type = validation.get("type")
+        
+        if v_type == "unique":
+            columns = validation.get("columns", [])
             
-            self.logger.info(f"Data passed {len(validations)} validations")
-            return True
+            if validation.get("combined", False):
+                # Uniqueness of the column combination rather than of each column
+                def check(df: pd.DataFrame) -> None:
+                    if df.duplicated(subset=columns).any():
+                        raise ValidationError(f"Columns {columns} contain duplicate values")
+            else:
+                def check(df: pd.DataFrame) -> None:
+                    for column in columns:
+                        if not df[column].is_unique:
+                            raise ValidationError(f"Column '{column}' contains duplicate values")
+        
+        elif v_type == "regex":
+            column = validation.get("column")
+            pattern = validation.get("pattern")
+            try:
+                compiled = re.compile(pattern)
+            except (re.error, TypeError) as e:
+                raise ValidationError(f"Invalid pattern '{pattern}' for column '{column}': {str(e)}")
+            
+            def check(df: pd.DataFrame) -> None:
+                # Match each distinct value once instead of every row
+                values = pd.Series(df[column].unique())
+                distinct = values.astype('string')
+                nulls = values.isna()
+                if nulls.any():
+                    # Nulls are matched as their string form ("nan", "None", "NaT")
+                    distinct = distinct.astype(object)
+                    distinct[nulls] = [str(value) for value in values[nulls]]
+                if not distinct.str.match(compiled).all():
+                    raise ValidationError(f"Column '{column}' contains values not matching pattern '{pattern}'")
+        
+        elif v_type == "custom":
+            validation_fn = validation.get("function")
+            message = validation.get('message', 'No message provided')
             
-        except ValidationError as e:
-            raise e
-        except Exception as e:
-            error_msg = f"Error during validation: {str(e)}"
-            self.logger.error(error_msg)
-            raise ValidationError(error_msg)
+            def check(df: pd.DataFrame) -> None:
+                if not validation_fn(df):
+                    raise ValidationError(f"Custom validation failed: {message}")
+        
+        else:
+            return None
+        
+        return check
     
     def _rename_columns(self, df: pd.DataFrame, mapping: Dict[str, str]) -> pd.DataFrame:
-        """Rename columns based on mapping."""
-        return df.rename(columns=mapping)
+        """Rename columns based on mapping (modifies df in place)."""
+        df.rename(columns=mapping, inplace=True)
+        return df
     
     def _drop_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
-        """Drop specified columns."""
-        return df.drop(columns=[col for col in columns if col in df.columns])
+        """Drop specified columns (modifies df in place)."""
+        df.drop(columns=[col for col in columns if col in df.columns], inplace=True)
+        return df
     
     def _fill_na(self, df: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
-        """Fill NA values in specified columns."""
-        result = df.copy()
-        for column, value in columns.items():
-            if column in result.columns:
-                result[column] = result[column].fillna(value)
-        return result
+        """Fill NA values in specified columns (modifies df in place)."""
+        values = {column: value for column, value in columns.items() if column in df.columns}
+        if values:
+            df.fillna(value=values, inplace=True)
+        return df
     
-    def _convert_types(self, df: pd.DataFrame, type_mapping: Dict[str, str]) -> pd.DataFrame:
-        """Convert column data types."""
-        result = df.copy()
+    def _convert_types(self, df: pd.DataFrame, type_mapping: Dict[str, str],
+                       auto_category: bool = False) -> pd.DataFrame:
+        """
+        Convert column data types, one call per target type (modifies df in place).
         
+        Besides "datetime", "float", "float32", "int", "int32", "int16",
+        "int8", "str" and "bool", any pandas dtype name is accepted, e.g. "category" for repetitive string columns.
+        With auto_category, "str" columns whose distinct values make up less
+        than half of the rows are stored as "category" instead.
+        """
+        groups: Dict[str, List[str]] = {}
         for column, dtype in type_mapping.items():
-            if column not in result.columns:
-                self.logger.warning(f"Column '{column}' not found for type conversion")
+            if column not in df.columns:
+                self.logger.warning("Column '%s' not found for type conversion", column)
                 continue
-                
+            groups.setdefault(dtype, []).append(column)
+        
+        for dtype, columns in groups.items():
             try:
-                if dtype == "datetime":
-                    result[column] = pd.to_datetime(result[column], errors='coerce')
-                elif dtype == "float":
-                    result[column] = pd.to_numeric(result[column], errors='coerce').astype(float)
-                elif dtype == "int":
-                    result[column] = pd.to_numeric(result[column], errors='coerce').astype('Int64')  # Nullable integer type
-                elif dtype == "str":
-                    result[column] = result[column].astype(str)
-                elif dtype == "bool":
-                    result[column] = result[column].astype(bool)
-                else:
-                    result[column] = result[column].astype(dtype)
-            except Exception as e:
-                self.logger.error(f"Error converting column '{column}' to type '{dtype}': {str(e)}")
-                raise TransformationError(f"Error converting column '{column}' to type '{dtype}': {str(e)}")
+                self._convert_group(df, columns, dtype)
+            except Exception:
+                # Retry column by column so the error names the offending column
+                for column in columns:
+                    try:
+                        self._convert_group(df, [column], dtype)
+                    except Exception as e:
+                        self.logger.error(f"Error converting column '{column}' to type '{dtype}': {str(e)}")
+                        raise TransformationError(f"Error converting column '{column}' to type '{dtype}': {str(e)}")
+        
+        if auto_category and len(df):
+            for column in groups.get("str", []):
+                if df[column].nunique() / len(df) < 0.5:
+                    df[column] = df[column].astype('category')
                 
-        return result
+        return df
+    
+    def _convert_group(self, df: pd.DataFrame, columns: List[str], dtype: str) -> None:
+        """Convert a group of columns that share the same target type."""
+        if dtype == "datetime":
+            # to_datetime on a DataFrame assembles dates from parts, so go per column
+            for column in columns:
+                df[column] = pd.to_datetime(df[column], errors='coerce')
+        elif dtype == "float32":
+            numeric = df[columns].apply(pd.to_numeric, errors='coerce')
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                converted = numeric.astype(_NUMERIC_TYPES[dtype])
+            # Unlike the integer casts, float32 turns values out of range into inf instead of failing
+            overflow = np.isinf(converted.to_numpy()) & np.isfinite(numeric.to_numpy(dtype="float64", na_value=np.nan))
+            if overflow.any():
+                raise OverflowError("value out of range for float32")
+            df[columns] = converted
+        elif dtype in _NUMERIC_TYPES:
+            df[columns] = df[columns].apply(pd.to_numeric, errors='coerce').astype(_NUMERIC_TYPES[dtype])
+        else:
+            df[columns] = df[columns].astype(dtype)
 
     # Instance methods instead of static methods
     def standardize_text(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
-        """Standardize text in specified columns (lowercase, strip whitespace)."""
-        result = df.copy()
+        """Standardize text in specified columns (lowercase, strip whitespace; modifies df in place)."""
         for column in columns:
-            if column in result.columns and result[column].dtype == object:
-                result[column] = result[column].astype(str).str.lower().str.strip()
-        return result
+            if column not in df.columns:
+                continue
+            dtype = df[column].dtype
+            # Text is object dtype before pandas 3 and a string dtype from then on
+            if dtype == object or isinstance(dtype, pd.StringDtype):
+                df[column] = self._lower_strip(df[column])
+        return df
+    
+    def _lower_strip(self, series: pd.Series) -> pd.Series:
+        """Lowercase and strip a text column, with Arrow kernels when pyarrow is installed."""
+        if _HAS_PYARROW:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            
+            try:
+                values = pa.array(series, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                values = None
+            # Mixed-type object columns need the str() conversion below
+            if values is not None and (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+                cleaned = pc.utf8_trim_whitespace(pc.utf8_lower(values))
+                dtype = series.dtype if isinstance(series.dtype, pd.StringDtype) else _STR_DTYPE
+                return pd.Series(cleaned, index=series.index, dtype=dtype, name=series.name)
+        
+        # Keep nulls missing as the Arrow kernels do, rather than "nan"/"None"
+        return series.astype(str).str.lower().str.strip().where(series.notna(), None)
     
     def add_date_parts(self, df: pd.DataFrame, date_column: str, drop_original: bool = False) -> pd.DataFrame:
-        """Extract date components from a date column."""
-        result = df.copy()
+        """Extract date components from a date column (modifies df in place)."""
+        result = df
         
         if date_column not in result.columns:
             return result
@@ -209,15 +625,38 @@ class Transformer:
         if not pd.api.types.is_datetime64_dtype(result[date_column]):
             result[date_column] = pd.to_datetime(result[date_column], errors='coerce')
             
-        # Extract date parts
-        result[f"{date_column}_year"] = result[date_column].dt.year
-        result[f"{date_column}_month"] = result[date_column].dt.month
-        result[f"{date_column}_day"] = result[date_column].dt.day
-        result[f"{date_column}_dayofweek"] = result[date_column].dt.dayofweek
-        result[f"{date_column}_quarter"] = result[date_column].dt.quarter
+        # Extract all date parts from one datetime64 buffer; tz-aware values
+        # are converted to their local wall time first, like the .dt accessor
+        dates = result[date_column]
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            dates = dates.dt.tz_localize(None)
+        values = dates.to_numpy()
+        
+        months = values.astype('datetime64[M]')
+        days = values.astype('datetime64[D]')
+        month_index = months.astype(np.int64)
+        day_index = days.astype(np.int64)
+        
+        parts = {
+            "year": month_index // 12 + 1970,
+            "month": month_index % 12 + 1,
+            "day": (days - months.astype('datetime64[D]')).astype(np.int64) + 1,
+            "dayofweek": (day_index + 3) % 7,  # 1970-01-01 was a Thursday; Monday=0
+        }
+        parts["quarter"] = (parts["month"] - 1) // 3 + 1
+        
+        missing = np.isnat(values)
+        has_missing = missing.any()
+        for name, part in parts.items():
+            if has_missing:
+                part = part.astype(np.float64)
+                part[missing] = np.nan
+            else:
+                part = part.astype(np.int32)
+            result[f"{date_column}_{name}"] = part
         
         # Drop original column if requested
         if drop_original:
-            result = result.drop(columns=[date_column])
+            result.drop(columns=[date_column], inplace=True)
             
         return result
\ No newline at end of file
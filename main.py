@@ -1,29 +1,35 @@
 import os
 import sys
 import argparse
-import pandas as pd
+import contextlib
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Callable
 import concurrent.futures
+import itertools
+import multiprocessing
+import threading
 import traceback
 
 from config.settings import Settings
-from utils.logger import setup_logger
+from utils.logger import setup_logger, setup_queue_logger, forward_logs
 from utils.exceptions import ETLError
+from utils.concurrency import BackgroundConsumer, prefetch
 from etl.extract import Extractor
-from etl.transform import Transformer
+from etl.transform import Transformer, enable_copy_on_write
 from etl.load import Loader
 
 def process_file(
     file_path: Path,
     extractor: Extractor,
-    transformer: Transformer,
     loader: Loader,
-    transformations: List[Dict[str, Any]],
-    validations: List[Dict[str, Any]],
+    transform: Optional[Callable[[Any], Any]],
+    validate: Optional[Callable[[Any], bool]],
     table_name: str,
-    schema: Optional[str] = None
+    schema: Optional[str] = None,
+    file_index: int = 0,
+    prefetch_batches: int = 2,
+    read_options: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Process a single CSV file through the ETL pipeline.
@@ -31,12 +37,16 @@ def process_file(
     Args:
         file_path: Path to CSV file
         extractor: Extractor instance
-        transformer: Transformer instance
         loader: Loader instance
-        transformations: List of transformations
-        validations: List of validations
+        transform: Compiled transformations (see Transformer.compile), or None
+        validate: Compiled validations (see Transformer.compile_validations), or None
         table_name: Target table name
         schema: Target database schema (optional)
+        file_index: Position of the file in the run; the first file replaces the table
+        prefetch_batches: Batches buffered ahead of the transform and behind it for
+            the background loader thread (0 disables both)
+        read_options: Transformation work pushed into the CSV reader
+            (see Transformer.as_read_csv_kwargs)
         
     Returns:
         Dictionary with processing results
@@ -53,32 +63,62 @@ def process_file(
     try:
         logger.info(f"Starting ETL process for {file_path}")
         
-        # Extract
         total_rows = 0
         total_loaded = 0
+        first_file = file_index == 0
         
-        for batch_idx, df in enumerate(extractor.extract_from_file(file_path)):
-            batch_rows = len(df)
-            total_rows += batch_rows
-            logger.info(f"Processing batch {batch_idx + 1} with {batch_rows} rows")
-            
-            # Transform
-            transformed_df = transformer.transform(df, transformations)
+        if transform is None and validate is None and loader.supports_copy():
+            # Nothing to transform or validate: stream the file straight into COPY
+            with extractor.open_raw(file_path) as f:
+                if first_file or not loader.table_exists(table_name, schema):
+                    sample = extractor.read_sample(file_path)
+                    loader.create_table_from_dataframe(sample, table_name, schema, if_exists="replace")
+                
+                total_loaded = loader.copy_from_stream(
+                    f,
+                    table_name,
+                    schema=schema,
+                    columns=extractor.get_column_names(file_path),
+                    delimiter=extractor.delimiter,
+                    quotechar=extractor.quotechar,
+                    encoding=extractor.encoding
+                )
+            total_rows = total_loaded
+        
+        else:
+            def load_batch(batch: Tuple[int, Any]) -> int:
+                batch_idx, transformed_df = batch
+                rows_loaded = loader.load_dataframe(
+                    transformed_df,
+                    table_name, 
+                    schema=schema,
+                    if_exists="replace" if first_file and batch_idx == 0 else "append"
+                )
+                logger.info("Loaded %d rows from batch %d", rows_loaded, batch_idx + 1)
+                return rows_loaded
             
-            # Validate
-            if validations:
-                transformer.validate_data(transformed_df, validations)
+            # Extract, parsing ahead while the current batch is transformed,
+            # and load on a background thread while the next one is prepared.
+            # Closing the reader stops its thread even when a load fails
+            batches = prefetch(extractor.extract_from_file(file_path, **(read_options or {})), prefetch_batches)
             
-            # Load
-            rows_loaded = loader.load_dataframe(
-                transformed_df,
-                table_name, 
-                schema=schema,
-                if_exists="append" if batch_idx > 0 or extractor.list_csv_files().index(file_path) > 0 else "replace"
-            )
+            with contextlib.closing(batches), BackgroundConsumer(load_batch, prefetch_batches, name="loader") as loads:
+                for batch_idx, df in enumerate(batches):
+                    batch_rows = len(df)
+                    total_rows += batch_rows
+                    logger.info("Processing batch %d with %d rows", batch_idx + 1, batch_rows)
+                    
+                    # Transform
+                    transformed_df = transform(df) if transform else df
+                    
+                    # Validate
+                    if validate:
+                        validate(transformed_df)
+                    
+                    # Load
+                    loads.submit((batch_idx, transformed_df))
             
-            total_loaded += rows_loaded
-            logger.info(f"Loaded {rows_loaded} rows from batch {batch_idx + 1}")
+            total_loaded = sum(loads.results)
         
         # Archive the file after successful processing
         extractor.archive_file(file_path)
@@ -102,6 +142,176 @@ def process_file(
     
     return result
 
+def compile_steps(
+    transformer: Transformer,
+    transformations: List[Dict[str, Any]],
+    validations: List[Dict[str, Any]]
+) -> Tuple[Optional[Callable[[Any], Any]], Optional[Callable[[Any], bool]], Dict[str, Any]]:
+    """
+    Compile transformation and validation configs for process_file.
+    
+    Args:
+        transformer: Transformer instance
+        transformations: List of transformations
+        validations: List of validations
+        
+    Returns:
+        Compiled transform and validate functions, None where the config is
+        empty so process_file skips the step (and its per-batch copy), and
+        the reader options for the transformations
+    """
+    transform = transformer.compile(transformations) if transformations else None
+    validate = transformer.compile_validations(validations) if validations else None
+    return transform, validate, transformer.as_read_csv_kwargs(transformations)
+
+# Pipeline components owned by the current worker (process or thread)
+_worker = threading.local()
+
+def _init_worker(config: Dict[str, Any], log_queue: Optional[Any] = None) -> None:
+    """
+    Build the pipeline components for a worker.
+    
+    Args:
+        config: Full pipeline configuration
+        log_queue: Queue a worker process logs into; worker threads share
+            the parent's logger and pass None
+    """
+    if log_queue is not None:
+        logger = setup_queue_logger(config["logging"], log_queue)
+        enable_copy_on_write()
+    else:
+        logger = logging.getLogger("etl_pipeline")
+    _worker.extractor = Extractor(config["csv"], logger)
+    _worker.transformer = Transformer(logger)
+    _worker.loader = Loader(config["database"], logger)
+    _worker.loader.connect()
+    _worker.prefetch_batches = config["processing"].get("prefetch_batches", 2)
+
+def _process_file_in_worker(
+    file_path: Path,
+    transformations: List[Dict[str, Any]],
+    validations: List[Dict[str, Any]],
+    table_name: str,
+    schema: Optional[str] = None,
+    file_index: int = 0
+) -> Dict[str, Any]:
+    """Run process_file with the current worker's own components."""
+    # Compiled steps are closures and cannot be sent to workers; compile here
+    transform, validate, read_options = compile_steps(_worker.transformer, transformations, validations)
+    return process_file(
+        file_path,
+        _worker.extractor,
+        _worker.loader,
+        transform,
+        validate,
+        table_name,
+        schema,
+        file_index,
+        _worker.prefetch_batches,
+        read_options
+    )
+
+def run_parallel(
+    csv_files: List[Path],
+    config: Dict[str, Any],
+    transformations: List[Dict[str, Any]],
+    validations: List[Dict[str, Any]],
+    table_name: str,
+    schema: Optional[str] = None,
+    max_workers: int = 4,
+    io_bound: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Process CSV files in parallel workers.
+    
+    Workers are spawned processes, so CPU-bound transforms are not
+    serialized by the GIL; with io_bound they are threads instead, which
+    suits pipelines dominated by database writes. Each worker builds its
+    own extractor, transformer and database connection. The first file
+    runs on its own since it replaces the table; after that at most
+    2 * max_workers files are in flight at a time.
+    
+    Args:
+        csv_files: CSV files to process
+        config: Full pipeline configuration
+        transformations: List of transformations
+        validations: List of validations
+        table_name: Target table name
+        schema: Target database schema (optional)
+        max_workers: Number of workers
+        io_bound: Use worker threads instead of processes
+        
+    Returns:
+        List of per-file processing results
+    """
+    logger = logging.getLogger("etl_pipeline")
+    results = []
+    max_in_flight = 2 * max_workers
+    pending_files = enumerate(csv_files)
+    
+    if io_bound:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(config,)
+        )
+        log_forwarder = None
+    else:
+        # Spawned workers start clean rather than inheriting this process's
+        # threads and open connections through fork. Their records come back
+        # over a queue so only this process writes the log file
+        mp_context = multiprocessing.get_context("spawn")
+        log_queue = mp_context.Queue()
+        log_forwarder = forward_logs(log_queue)
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(config, log_queue)
+        )
+    
+    try:
+        with executor:
+            future_to_file = {}
+            
+            while True:
+                # Top up the in-flight window. The first file replaces the table,
+                # so it runs alone; appends from other files would be dropped
+                window = max_in_flight if results else 1
+                for file_index, file in itertools.islice(pending_files, window - len(future_to_file)):
+                    future = executor.submit(
+                        _process_file_in_worker,
+                        file,
+                        transformations,
+                        validations,
+                        table_name,
+                        schema,
+                        file_index
+                    )
+                    future_to_file[future] = file
+            
+                if not future_to_file:
+                    break
+            
+                done, _ = concurrent.futures.wait(future_to_file, return_when=concurrent.futures.FIRST_COMPLETED)
+            
+                for future in done:
+                    file = future_to_file.pop(future)
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        logger.error(f"Error processing {file}: {str(e)}")
+                        results.append({
+                            "file": str(file),
+                            "success": False,
+                            "error": str(e)
+                        })
+    finally:
+        if log_forwarder is not None:
+            log_forwarder.stop()
+    
+    return results
+
 def main() -> None:
     """Main entry point for the ETL pipeline."""
     # Parse command line arguments
@@ -119,6 +329,9 @@ def main() -> None:
         logger = setup_logger(settings.get("logging"))
         logger.info("Starting ETL pipeline")
         
+        # Let transforms copy only the columns they modify
+        enable_copy_on_write()
+        
         # Initialize components
         extractor = Extractor(settings.get("csv"), logger)
         transformer = Transformer(logger)
@@ -131,8 +344,11 @@ def main() -> None:
         table_name = args.table or "csv_data"
         schema = args.schema
         
-        # List CSV files
-        csv_files = extractor.list_csv_files()
+        # Prefetch existing tables so per-file existence checks stay in memory
+        loader.refresh_table_cache(schema)
+        
+        # List CSV files once, in a stable order: the first file replaces the table
+        csv_files = sorted(extractor.list_csv_files())
         
         if not csv_files:
             logger.info("No CSV files found to process")
@@ -148,10 +364,10 @@ def main() -> None:
                 "mapping": {
                     "transaction_id": "int",
                     "date": "datetime",
-                    "customer_id": "str",
-                    "product_id": "str",
-                    "product_name": "str",
-                    "quantity": "int",
+                    "customer_id": "category",
+                    "product_id": "category",
+                    "product_name": "category",
+                    "quantity": "int32",
                     "unit_price": "float",
                     "total_amount": "float"
                 }
@@ -183,46 +399,34 @@ def main() -> None:
         if parallel and len(csv_files) > 1:
             logger.info(f"Processing {len(csv_files)} files in parallel with {max_workers} workers")
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_file = {
-                    executor.submit(
-                        process_file, 
-                        file, 
-                        extractor, 
-                        transformer, 
-                        loader, 
-                        transformations, 
-                        validations, 
-                        table_name, 
-                        schema
-                    ): file for file in csv_files
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_file):
-                    file = future_to_file[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                    except Exception as e:
-                        logger.error(f"Error processing {file}: {str(e)}")
-                        results.append({
-                            "file": str(file),
-                            "success": False,
-                            "error": str(e)
-                        })
+            results = run_parallel(
+                csv_files,
+                settings.config,
+                transformations,
+                validations,
+                table_name,
+                schema,
+                max_workers,
+                processing_config.get("io_bound", False)
+            )
         else:
             logger.info(f"Processing {len(csv_files)} files sequentially")
             
-            for file in csv_files:
+            # Parse the configs once for all files
+            transform, validate, read_options = compile_steps(transformer, transformations, validations)
+            
+            for file_index, file in enumerate(csv_files):
                 result = process_file(
                     file, 
                     extractor, 
-                    transformer, 
                     loader, 
-                    transformations, 
-                    validations, 
+                    transform, 
+                    validate, 
                     table_name, 
-                    schema
+                    schema,
+                    file_index,
+                    processing_config.get("prefetch_batches", 2),
+                    read_options
                 )
                 results.append(result)
         
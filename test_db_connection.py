@@ -1,5 +1,7 @@
+import io
+
 import psycopg2
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 # Connection parameters - update with your values
 params = {
@@ -49,15 +51,15 @@ def test_sqlalchemy_connection():
     print("\nTesting connection with SQLAlchemy...")
     
     try:
-        # Create connection string
-        conn_str = f"postgresql://{params['user']}:{params['password']}@{params['host']}:{params['port']}/{params['database']}"
+        # Create connection string (pin psycopg2, which the pipeline's COPY loads use)
+        conn_str = f"postgresql+psycopg2://{params['user']}:{params['password']}@{params['host']}:{params['port']}/{params['database']}"
         
         # Create engine
         engine = create_engine(conn_str)
         
         # Connect and execute query
         with engine.connect() as conn:
-            result = conn.execute("SELECT version();")
+            result = conn.execute(text("SELECT version();"))
             version = result.fetchone()
             print(f"Successfully connected to PostgreSQL using SQLAlchemy: {version[0]}")
             
@@ -68,11 +70,44 @@ def test_sqlalchemy_connection():
         print(f"Error connecting with SQLAlchemy: {e}")
         return False
 
+def test_copy():
+    """Test a COPY FROM STDIN bulk load, which the pipeline uses for PostgreSQL"""
+    print("\nTesting COPY FROM STDIN...")
+    
+    try:
+        conn = psycopg2.connect(
+            host=params["host"],
+            port=params["port"],
+            database=params["database"],
+            user=params["user"],
+            password=params["password"]
+        )
+        cur = conn.cursor()
+        
+        # Load a few rows into a temporary table, dropped when the connection closes
+        cur.execute("CREATE TEMP TABLE etl_copy_check (id integer, name text);")
+        cur.copy_expert(
+            "COPY etl_copy_check (id, name) FROM STDIN WITH (FORMAT csv)",
+            io.StringIO("1,first\n2,second\n")
+        )
+        cur.execute("SELECT count(*) FROM etl_copy_check;")
+        count = cur.fetchone()[0]
+        print(f"Successfully loaded {count} rows with COPY")
+        
+        cur.close()
+        conn.close()
+        return count == 2
+        
+    except Exception as e:
+        print(f"Error running COPY: {e}")
+        return False
+
 if __name__ == "__main__":
     psycopg2_success = test_psycopg2_connection()
     sqlalchemy_success = test_sqlalchemy_connection()
+    copy_success = test_copy()
     
-    if psycopg2_success and sqlalchemy_success:
+    if psycopg2_success and sqlalchemy_success and copy_success:
         print("\n✅ Database connection tests passed! Your ETL pipeline should work correctly.")
     else:
         print("\n❌ Database connection tests failed. Please check your PostgreSQL setup and credentials.")
\ No newline at end of file
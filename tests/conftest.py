@@ -0,0 +1,34 @@
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+# Run against the working tree without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from etl.extract import Extractor
+
+@pytest.fixture
+def logger() -> logging.Logger:
+    return logging.getLogger("etl_pipeline.tests")
+
+@pytest.fixture
+def make_extractor(tmp_path, logger):
+    """Build an Extractor over tmp_path, with csv config overrides."""
+    (tmp_path / "archive").mkdir()
+    (tmp_path / "error").mkdir()
+    
+    def make(**overrides) -> Extractor:
+        config = {
+            "input_dir": str(tmp_path),
+            "archive_dir": str(tmp_path / "archive"),
+            "error_dir": str(tmp_path / "error"),
+            "delimiter": ",",
+            "quotechar": '"',
+            "encoding": "utf-8",
+            "batch_size": 1000,
+            **overrides,
+        }
+        return Extractor(config, logger)
+    return make
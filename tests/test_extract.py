@@ -0,0 +1,46 @@
+import importlib.util
+
+import pandas as pd
+import pytest
+
+from etl.transform import Transformer
+
+ENGINES = [
+    "pandas",
+    pytest.param("pyarrow", marks=pytest.mark.skipif(
+        importlib.util.find_spec("pyarrow") is None, reason="pyarrow is not installed"
+    )),
+]
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_utf8_bom_is_not_part_of_first_column(tmp_path, make_extractor, logger, engine):
+    path = tmp_path / "bom.csv"
+    path.write_bytes("\ufefftransaction_id,amount\n1,2.5\n2,\n".encode("utf-8"))
+    extractor = make_extractor(engine=engine)
+    
+    assert extractor.get_csv_schema(path) == ["transaction_id", "amount"]
+    
+    df = pd.concat(extractor.extract_from_file(path, expected_schema=["transaction_id"]))
+    assert list(df.columns) == ["transaction_id", "amount"]
+    
+    transformer = Transformer(logger)
+    transformed = transformer.transform(df, [{"type": "convert_types", "mapping": {"transaction_id": "int"}}])
+    assert str(transformed["transaction_id"].dtype) == "Int64"
+    assert transformer.validate_data(transformed, [{"type": "not_null", "columns": ["transaction_id"]}])
+
+def test_header_with_bom_falls_back_to_text_reader(tmp_path, make_extractor):
+    path = tmp_path / "bom.csv"
+    path.write_bytes("\ufeffa,b\n1,2\n".encode("utf-8"))
+    
+    assert make_extractor()._read_header_mmap(path) is None
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_column_names_match_read_csv(tmp_path, make_extractor, engine):
+    path = tmp_path / "names.csv"
+    path.write_text("id, amount ,id,id.1,id\n1,2,3,4,5\n")
+    extractor = make_extractor(engine=engine)
+    
+    # Whitespace is only ignored when checking the expected schema
+    assert extractor.get_csv_schema(path) == ["id", "amount", "id", "id.1", "id"]
+    df = pd.concat(extractor.extract_from_file(path, expected_schema=["amount"]))
+    assert list(df.columns) == list(pd.read_csv(path).columns)
@@ -0,0 +1,68 @@
+import gc
+import threading
+
+import main
+from utils.exceptions import LoadError
+
+class RecordingLoader:
+    """Loader double for the COPY passthrough path, recording the columns it is given."""
+    
+    def __init__(self):
+        self.created_columns = None
+        self.copied_columns = None
+    
+    def supports_copy(self):
+        return True
+    
+    def table_exists(self, table_name, schema=None):
+        return self.created_columns is not None
+    
+    def create_table_from_dataframe(self, df, table_name, schema=None, dtypes=None, if_exists="fail", primary_key=None):
+        self.created_columns = list(df.columns)
+    
+    def copy_from_stream(self, file_obj, table_name, schema=None, columns=None, **options):
+        self.copied_columns = columns
+        return sum(1 for _ in file_obj) - 1
+
+def test_passthrough_copy_with_repeated_header(tmp_path, make_extractor):
+    path = tmp_path / "dup.csv"
+    path.write_text("x,y,x\n1,2,3\n4,5,6\n")
+    loader = RecordingLoader()
+    
+    result = main.process_file(path, make_extractor(), loader, None, None, "t")
+    
+    assert result["success"], result["error"]
+    assert result["rows_loaded"] == 2
+    assert loader.created_columns == ["x", "y", "x.1"]
+    assert loader.copied_columns == loader.created_columns
+
+class FailingLoader:
+    """Loader double whose second batch load fails."""
+    
+    def __init__(self):
+        self.loaded = 0
+    
+    def supports_copy(self):
+        return False
+    
+    def load_dataframe(self, df, table_name, schema=None, if_exists="append"):
+        if self.loaded:
+            raise LoadError("connection lost")
+        self.loaded += len(df)
+        return len(df)
+
+def test_load_failure_mid_file_stops_the_reader(tmp_path, make_extractor):
+    path = tmp_path / "rows.csv"
+    path.write_text("a\n" + "".join(f"{i}\n" for i in range(50)))
+    
+    # Without the cyclic collector, only an explicit close stops the prefetch thread
+    gc.disable()
+    try:
+        result = main.process_file(path, make_extractor(batch_size=5), FailingLoader(), None, None, "t", prefetch_batches=2)
+        prefetching = [thread for thread in threading.enumerate() if thread.name == "prefetch"]
+    finally:
+        gc.enable()
+    
+    assert not result["success"]
+    assert "connection lost" in result["error"]
+    assert prefetching == []
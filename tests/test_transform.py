@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl.transform import Transformer
+from utils.exceptions import TransformationError, ValidationError
+
+@pytest.mark.parametrize("values", [
+    ["abc", None, "de"],
+    [1.5, np.nan, 2.0],
+    pd.array(["abc", None], dtype="string"),
+])
+def test_regex_matches_nulls_as_their_string_form(logger, values):
+    df = pd.DataFrame({"code": values})
+    transformer = Transformer(logger)
+    
+    # A permissive pattern accepts the column, nulls included
+    assert transformer.validate_data(df, [{"type": "regex", "column": "code", "pattern": ".*"}])
+    # A null is a non-digit string ("nan", "None", "<NA>"), so it fails a digits-only pattern
+    with pytest.raises(ValidationError):
+        transformer.validate_data(df, [{"type": "regex", "column": "code", "pattern": r"^[\d.]+$"}])
+
+@pytest.mark.parametrize("dtype, value", [("int8", "300"), ("int32", str(2 ** 40)), ("float32", "1e39")])
+def test_convert_types_rejects_values_out_of_range(logger, dtype, value):
+    df = pd.DataFrame({"amount": ["1", value], "other": ["2", "3"]})
+    
+    with pytest.raises(TransformationError, match="'amount'"):
+        Transformer(logger).transform(df, [{"type": "convert_types", "mapping": {"amount": dtype, "other": dtype}}])
+
+def test_convert_types_float32_keeps_infinity_from_the_input(logger):
+    df = pd.DataFrame({"amount": ["1.5", "inf", "", "x"]})
+    
+    converted = Transformer(logger).transform(df, [{"type": "convert_types", "mapping": {"amount": "float32"}}])
+    
+    assert str(converted["amount"].dtype) == "float32"
+    assert np.isinf(converted["amount"][1])
+    assert converted["amount"][2:].isna().all()
+
+def test_plan_merges_conversions_across_fills_of_other_columns(logger):
+    transformations = [
+        {"type": "convert_types", "mapping": {"transaction_id": "int", "date": "datetime", "quantity": "int32"}},
+        {"type": "fill_na", "columns": {"quantity": 0, "unit_price": 0.0}},
+        {"type": "convert_types", "mapping": {"customer_id": "category", "product_id": "category"}},
+        {"type": "convert_types", "mapping": {"unit_price": "float"}},
+    ]
+    
+    plan = Transformer(logger)._plan(transformations)
+    
+    # The last conversion touches a filled column, so it has to stay after the fill
+    assert [step["type"] for step in plan] == ["convert_types", "fill_na", "convert_types"]
+    assert plan[0]["mapping"] == {
+        "transaction_id": "int",
+        "date": "datetime",
+        "quantity": "int32",
+        "customer_id": "category",
+        "product_id": "category",
+    }
+    
+    df = pd.DataFrame({
+        "transaction_id": ["1", "2"],
+        "date": ["2024-01-01", None],
+        "quantity": ["3", None],
+        "unit_price": [None, "2.5"],
+        "customer_id": ["c1", "c1"],
+        "product_id": ["p1", "p2"],
+    })
+    expected = df.copy()
+    for step in transformations:
+        expected = Transformer(logger).transform(expected, [step])
+    pd.testing.assert_frame_equal(Transformer(logger).transform(df, transformations), expected)
@@ -0,0 +1,150 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Marks the end of the producer's stream
+_DONE = object()
+
+def prefetch(iterable: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """
+    Iterate over an iterable while a background thread produces ahead.
+
+    The producer runs at most depth items ahead of the consumer, so memory
+    stays bounded while producing the next item overlaps with the work done
+    on the current one. Exceptions raised by the producer are re-raised in
+    the consumer.
+
+    Args:
+        iterable: Source of items, e.g. a batch generator
+        depth: Maximum number of items buffered ahead (0 disables prefetching)
+
+    Yields:
+        Items from the iterable, in order
+    """
+    if depth <= 0:
+        yield from iterable
+        return
+
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Poll so the producer notices when the consumer has gone away
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+            put((_DONE, None))
+        except Exception as e:
+            put((_DONE, e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+class BackgroundConsumer:
+    """
+    Feed items to a function running on a background thread.
+
+    Items are handed over through a queue of at most depth entries, so the
+    submitting thread can prepare the next item while the current one is
+    consumed, and blocks once it gets too far ahead. Use as a context
+    manager: leaving the block waits for the queue to drain, and the first
+    exception raised by the function is re-raised in the submitting thread.
+    If the block itself raises, items still queued are discarded.
+
+    Attributes:
+        results: Return values of the function, in submission order
+    """
+
+    def __init__(self, fn: Callable[[T], Any], depth: int = 2, name: str = "consumer"):
+        """
+        Initialize the consumer.
+
+        Args:
+            fn: Function called once per submitted item
+            depth: Maximum number of items queued (0 runs fn inline)
+            name: Name of the background thread
+        """
+        self.fn = fn
+        self.depth = depth
+        self.name = name
+        self.results: List[Any] = []
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(depth, 1))
+        self._cancelled = threading.Event()
+        self._error: Optional[Exception] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "BackgroundConsumer":
+        if self.depth > 0:
+            self._thread = threading.Thread(target=self._consume, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._thread is None:
+            return
+        if exc_type is not None:
+            self._cancelled.set()
+        # The consumer keeps draining after errors, so this cannot block for long
+        self._queue.put(_DONE)
+        self._thread.join()
+        if exc_type is None and self._error is not None:
+            raise self._error
+
+    def submit(self, item: T) -> None:
+        """
+        Queue an item for the background function.
+
+        Args:
+            item: Item to pass to the function
+
+        Raises:
+            Exception: Whatever the function raised for an earlier item
+        """
+        if self._thread is None:
+            self.results.append(self.fn(item))
+            return
+        if self._error is not None:
+            raise self._error
+        self._queue.put(item)
+
+    def _consume(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            # After a failure, drain without processing so submitters never block
+            if self._error is not None or self._cancelled.is_set():
+                continue
+            try:
+                self.results.append(self.fn(item))
+            except Exception as e:
+                self._error = e
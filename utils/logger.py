@@ -1,11 +1,31 @@
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Writes queued records to the console and log file on a background thread
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_listener() -> None:
+    """Flush queued records and close the handlers of the current listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(_stop_listener)
 
 def setup_logger(config:Dict[str,Any])->logging.Logger:
     """
     Set up a configured logger
+    
+    Records are put on a queue and written to the console and file by a
+    listener thread, so log I/O does not block the pipeline. Calling this
+    again replaces the previous listener.
     Args:
         config: Logging configuration
     Returns:
@@ -25,13 +45,13 @@ def setup_logger(config:Dict[str,Any])->logging.Logger:
     #Remove existing handler
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    _stop_listener()
 
     #create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_formatter = logging.Formatter(log_format)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     #create file handler
     file_handler = logging.handlers.RotatingFileHandler(
@@ -42,6 +62,51 @@ def setup_logger(config:Dict[str,Any])->logging.Logger:
     file_handler.setLevel(log_level)
     file_formatter = logging.Formatter(log_format)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    #hand records to the handlers through a queue
+    global _listener
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
 
     return logger
+
+def setup_queue_logger(config: Dict[str, Any], log_queue: Any) -> logging.Logger:
+    """
+    Set up the logger of a worker process to hand records to the parent
+    
+    The worker only puts records on the queue; the parent forwards them to
+    its own listener, so a single process writes the console and log file.
+    Args:
+        config: Logging configuration
+        log_queue: Multiprocessing queue read by forward_logs in the parent
+    Returns:
+        configured logger
+    """
+    logger = logging.getLogger("etl_pipeline")
+    logger.setLevel(getattr(logging, config["level"].upper()))
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    _stop_listener()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return logger
+
+def forward_logs(log_queue: Any) -> logging.handlers.QueueListener:
+    """
+    Start passing records from worker processes to this process's logger
+    
+    Args:
+        log_queue: Multiprocessing queue the workers log into
+    Returns:
+        started listener; stop it once the workers have exited
+    """
+    logger = logging.getLogger("etl_pipeline")
+    listener = logging.handlers.QueueListener(log_queue, *logger.handlers)
+    listener.start()
+    return listener